@@ -19,11 +19,20 @@ import sys
 PROJECT_ROOT = Path(__file__).resolve().parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from config.settings import APP_SETTINGS, POSTGRES_SETTINGS, MODEL_SETTINGS
+from config.settings import APP_SETTINGS, POSTGRES_SETTINGS, MODEL_SETTINGS, CACHE_SETTINGS
 from config.constants import COLOR_PALETTE
 from app.styles.theme import apply_custom_theme
 from app.components.sidebar import render_sidebar
+from app.components.navbar import render_navbar
+from app.components.home import (
+    HEADER_HTML,
+    CARD_FORMULATEUR_HTML,
+    CARD_LABO_HTML,
+    CARD_COMPARATEUR_HTML,
+    FOOTER_HTML,
+)
 from app.models.loader import load_production_assets
+from app.core.session_manager import initialize_session
 from database.manager import DatabaseManager
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -70,7 +79,6 @@ st.set_page_config(
 # ═══════════════════════════════════════════════════════════════════════════════
 # INITIALISATION SESSION STATE
 # ═══════════════════════════════════════════════════════════════════════════════
-from app.core.session_manager import initialize_session
 
 initialize_session()
 
@@ -80,7 +88,6 @@ initialize_session()
 
 apply_custom_theme(st.session_state.get('app_theme', 'Clair'))
 
-from app.components.navbar import render_navbar
 render_navbar(current_page="Accueil")
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -89,25 +96,38 @@ render_navbar(current_page="Accueil")
 
 sidebar_state = render_sidebar(db_manager=st.session_state.get('db_manager'))
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# CACHE DONNÉES ACCUEIL
+# ═══════════════════════════════════════════════════════════════════════════════
+# Chaque interaction relance le script : sans cache, chaque rerun refait les
+# requêtes PostgreSQL. Le préfixe "_" exclut le DatabaseManager du hachage.
+
+_LIVE_STATS_TTL = CACHE_SETTINGS['cache_ttls']['live_stats']
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _db_alive(_db) -> bool:
+    # Une seule sonde toutes les 5 s : pendant une panne, seule celle-ci
+    # paie le délai d'attente, les reruns suivants sautent directement.
+    return _db.ping()
+
+
+@st.cache_data(ttl=_LIVE_STATS_TTL, show_spinner=False)
+def _cached_live_stats(_db):
+    return _db.get_live_stats()
+
+
+@st.cache_data(ttl=_LIVE_STATS_TTL, show_spinner=False)
+def _cached_recent_predictions(_db, limit: int = 5):
+    return _db.get_recent_predictions(limit=limit)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # PAGE ACCUEIL (CONTENU PRINCIPAL)
 # ═══════════════════════════════════════════════════════════════════════════════
 
 # Header
-st.markdown(
-    f"""
-    <div style="text-align: center; padding: 2rem 0;">
-        <h1 style="font-size: 3rem; color: {COLOR_PALETTE['primary']}; margin: 0;">
-            {APP_SETTINGS['app_icon']} {APP_SETTINGS['app_name']}
-        </h1>
-        <p style="font-size: 1.2rem; color: {COLOR_PALETTE['secondary']}; margin-top: 0.5rem;">
-            Intelligence Artificielle pour la Formulation du Béton
-        </p>
-        <hr style="width: 50%; margin: 1.5rem auto; border: none; border-top: 3px solid {COLOR_PALETTE['accent']};">
-    </div>
-    """,
-    unsafe_allow_html=True
-)
+st.markdown(HEADER_HTML, unsafe_allow_html=True)
 
 # ─── PRÉSENTATION ───
 col1, col2, col3 = st.columns([1, 2, 1])
@@ -135,11 +155,43 @@ with col2:
     )
 
 # ─── STATISTIQUES RAPIDES ───
-st.markdown("### 📊 Aperçu des Performances")
+col_title, col_refresh = st.columns([5, 1])
+
+with col_title:
+    st.markdown("### 📊 Aperçu des Performances")
+
+with col_refresh:
+    if st.button("↻ Actualiser", use_container_width=True):
+        _cached_live_stats.clear()
+        _cached_recent_predictions.clear()
+
+# Appels directs sur le thread du script (contexte Streamlit requis par
+# st.cache_data), chacun avec sa propre gestion d'erreur pour qu'un échec
+# n'empêche pas l'affichage de l'autre bloc. Une base injoignable est déjà
+# écartée par _db_alive ; l'ouverture de connexion est bornée par
+# connect_timeout et chaque lecture par statement_timeout, sans nouvelle
+# tentative (cf. _LIVE_READ_TIMEOUT_MS dans database/manager.py).
+db = st.session_state.get('db_manager')
+if db and not _db_alive(db):
+    db = None
+stats, stats_error = None, None
+recent, recent_error = None, None
+
+if db:
+    try:
+        stats = _cached_live_stats(db)
+    except Exception as e:
+        stats_error = e
+
+    try:
+        recent = _cached_recent_predictions(db, 5)
+    except Exception as e:
+        recent_error = e
 
-if st.session_state.get('db_manager'):
+if db:
     try:
-        stats = st.session_state['db_manager'].get_live_stats()
+        if stats_error is not None:
+            raise stats_error
         
         col_s1, col_s2, col_s3, col_s4 = st.columns(4)
         
@@ -182,55 +234,19 @@ st.markdown("### 🚀 Démarrage Rapide")
 col_q1, col_q2, col_q3 = st.columns(3)
 
 with col_q1:
-    st.markdown(
-        """
-        <div style="background: linear-gradient(135deg, #1e3c7215 0%, #1e3c7205 100%); 
-                    border-left: 4px solid #1e3c72; 
-                    padding: 1.5rem; 
-                    border-radius: 8px;">
-            <h4 style="margin-top: 0;">📊 Formulateur</h4>
-            <p>Saisissez votre composition et obtenez instantanément les prédictions 
-            de résistance, diffusion des chlorures et carbonatation.</p>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+    st.markdown(CARD_FORMULATEUR_HTML, unsafe_allow_html=True)
     
     if st.button("➡️ Accéder au Formulateur", use_container_width=True, type="primary"):
         st.switch_page("pages/1_Formulateur.py")
 
 with col_q2:
-    st.markdown(
-        """
-        <div style="background: linear-gradient(135deg, #9c27b015 0%, #9c27b005 100%); 
-                    border-left: 4px solid #9c27b0; 
-                    padding: 1.5rem; 
-                    border-radius: 8px;">
-            <h4 style="margin-top: 0;">🧪 Laboratoire</h4>
-            <p>Analysez la sensibilité paramétrique et étudiez l'impact 
-            de chaque composant sur les propriétés du béton.</p>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+    st.markdown(CARD_LABO_HTML, unsafe_allow_html=True)
     
     if st.button("➡️ Lancer l'Analyse", use_container_width=True, type="primary"):
         st.switch_page("pages/2_Laboratoire.py")
 
 with col_q3:
-    st.markdown(
-        """
-        <div style="background: linear-gradient(135deg, #ff7f0e15 0%, #ff7f0e05 100%); 
-                    border-left: 4px solid #ff7f0e; 
-                    padding: 1.5rem; 
-                    border-radius: 8px;">
-            <h4 style="margin-top: 0;">⚖️ Comparateur</h4>
-            <p>Comparez jusqu'à 10 formulations côte à côte pour 
-            identifier la plus adaptée à vos besoins.</p>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+    st.markdown(CARD_COMPARATEUR_HTML, unsafe_allow_html=True)
     
     if st.button("➡️ Comparer", use_container_width=True, type="primary"):
         st.switch_page("pages/3_Comparateur.py")
@@ -240,38 +256,28 @@ st.markdown("---")
 # ─── DERNIÈRES PRÉDICTIONS ───
 st.markdown("### 🕐 Dernières Prédictions")
 
-if st.session_state.get('db_manager'):
+if db:
     try:
-        recent = st.session_state['db_manager'].get_recent_predictions(limit=5)
+        if recent_error is not None:
+            raise recent_error
         
         if recent:
-            # Créer DataFrame
-            import pandas as pd
-            df_recent = pd.DataFrame(recent)
-            
-            # Colonnes à afficher
-            display_cols = [
-                'formulation_name',
-                'resistance_predicted',
-                'diffusion_cl_predicted',
-                'carbonatation_predicted',
-                'ratio_e_l',
-                'created_at'
-            ]
-            
-            # Renommer pour affichage
-            df_display = df_recent[display_cols].copy()
-            df_display.columns = [
-                'Formulation',
-                'Résistance (MPa)',
-                'Diffusion Cl⁻',
-                'Carbonatation (mm)',
-                'Ratio E/L',
-                'Date'
+            # Liste de dicts passée directement à st.dataframe
+            # (pas de DataFrame pandas intermédiaire pour 5 lignes)
+            rows = [
+                {
+                    'Formulation':        r['formulation_name'],
+                    'Résistance (MPa)':   r['resistance_predicted'],
+                    'Diffusion Cl⁻':      r['diffusion_cl_predicted'],
+                    'Carbonatation (mm)': r['carbonatation_predicted'],
+                    'Ratio E/L':          r['ratio_e_l'],
+                    'Date':               r['created_at'],
+                }
+                for r in recent
             ]
             
             st.dataframe(
-                df_display,
+                rows,
                 width="stretch",
                 hide_index=True
             )
@@ -287,25 +293,4 @@ else:
 st.markdown("---")
 
 # ─── FOOTER ───
-st.markdown(
-    f"""
-    <div style="text-align: center; padding: 2rem 0; color: #6c757d;">
-        <p>
-            <strong>{APP_SETTINGS['institution']}</strong> | {APP_SETTINGS['campus']}  <br>
-            {APP_SETTINGS['department']}
-        </p>
-        <p style="font-size: 0.9rem;">
-            📧 {APP_SETTINGS['email']} | 📞 {APP_SETTINGS['phone']}  <br>
-            🌐 <a href="{APP_SETTINGS['website']}" target="_blank" style="color: {COLOR_PALETTE['primary']};">
-                {APP_SETTINGS['website']}
-            </a>
-        </p>
-        <hr style="width: 30%; margin: 1rem auto; border: none; border-top: 1px solid #e0e0e0;">
-        <p style="font-size: 0.85rem;">
-            © 2026 IMT Nord Europe - Tous droits réservés  <br>
-            Version {APP_SETTINGS['version']} | Powered by Streamlit & XGBoost
-        </p>
-    </div>
-    """,
-    unsafe_allow_html=True
-)
\ No newline at end of file
+st.markdown(FOOTER_HTML, unsafe_allow_html=True)
@@ -5,34 +5,45 @@ Description: Composants UI réutilisables pour Streamlit
 Auteur: Stage R&D - IMT Nord Europe
 Version: 1.0.0
 ═══════════════════════════════════════════════════════════════════════════════
+
+Les sous-modules sont chargés à la demande (PEP 562) : importer
+`app.components.sidebar` n'entraîne plus l'import de charts (plotly, scipy…).
 """
 
-from .sidebar import render_sidebar
-from .cards import metric_card, formulation_card, alert_banner
-from .forms import render_formulation_input, render_target_selector
-from .charts import (
-    plot_composition_pie,
-    plot_parallel_coordinates,
-    plot_sensitivity,
-    plot_performance_radar
-)
-
-__all__ = [
+import importlib
+
+# Nom exporté → sous-module qui le définit
+_LAZY_EXPORTS = {
     # Sidebar
-    'render_sidebar',
-    
+    'render_sidebar': 'sidebar',
+
     # Cards
-    'metric_card',
-    'formulation_card',
-    'alert_banner',
-    
+    'metric_card': 'cards',
+    'formulation_card': 'cards',
+    'alert_banner': 'cards',
+
     # Forms
-    'render_formulation_input',
-    'render_target_selector',
-    
+    'render_formulation_input': 'forms',
+    'render_target_selector': 'forms',
+
     # Charts
-    'plot_composition_pie',
-    'plot_parallel_coordinates',
-    'plot_sensitivity',
-    'plot_performance_radar'
-]
\ No newline at end of file
+    'plot_composition_pie': 'charts',
+    'plot_parallel_coordinates': 'charts',
+    'plot_sensitivity': 'charts',
+    'plot_performance_radar': 'charts',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY_EXPORTS[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # Les accès suivants ne repassent plus par __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
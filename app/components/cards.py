@@ -7,10 +7,14 @@ Version: 1.0.0 - Refactorisé & aligné avec ValidationReport v1.0.0
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
-import html as html_stdlib
 import logging
+import io
 import re
-from typing import Any, Callable, Dict, List, Optional
+import zlib
+from functools import lru_cache
+from itertools import count, islice
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import streamlit as st
 
@@ -25,30 +29,57 @@ logger = logging.getLogger(__name__)
 # CONSTANTES INTERNES
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Couleurs fréquemment utilisées, résolues une fois à l'import
+_PRIMARY = COLOR_PALETTE["primary"]
+_SUCCESS = COLOR_PALETTE.get("success", "#27ae60")
+_DANGER  = COLOR_PALETTE.get("danger",  "#e74c3c")
+_DARK    = UI_SETTINGS['colors']['dark']
+
+# Couleur de carte par clé QUALITY_THRESHOLDS (repli : primary)
+_GRADE_COLOR: Dict[str, str] = {
+    grade: COLOR_PALETTE.get(spec.get("color", "primary"), _PRIMARY)
+    for grade, spec in QUALITY_THRESHOLDS.items()
+}
+
 # Couleurs associées aux niveaux de sévérité (cohérent avec validator.py)
-_SEVERITY_COLORS: Dict[str, str] = {
-    "critical": COLOR_PALETTE.get("danger",  "#c0392b"),
-    "error":    COLOR_PALETTE.get("danger",  "#e74c3c"),
-    "warning":  COLOR_PALETTE.get("warning", "#f39c12"),
-    "info":     COLOR_PALETTE.get("info",    "#2980b9"),
+_SEVERITY_COLORS: Dict[Severity, str] = {
+    Severity.CRITICAL: COLOR_PALETTE.get("danger",  "#c0392b"),
+    Severity.ERROR:    COLOR_PALETTE.get("danger",  "#e74c3c"),
+    Severity.WARNING:  COLOR_PALETTE.get("warning", "#f39c12"),
+    Severity.INFO:     COLOR_PALETTE.get("info",    "#2980b9"),
 }
 
 # Emojis de sévérité
-_SEVERITY_EMOJIS: Dict[str, str] = {
-    "critical": "🚨",
-    "error":    "❌",
-    "warning":  "⚠️",
-    "info":     "ℹ️",
+_SEVERITY_EMOJIS: Dict[Severity, str] = {
+    Severity.CRITICAL: "🚨",
+    Severity.ERROR:    "❌",
+    Severity.WARNING:  "⚠️",
+    Severity.INFO:     "ℹ️",
 }
 
 # Correspondance sévérité → méthode Streamlit d'affichage
-_SEVERITY_ST_FN: Dict[str, Any] = {
-    "critical": st.error,
-    "error":    st.error,
-    "warning":  st.warning,
-    "info":     st.info,
+_SEVERITY_ST_FN: Dict[Severity, Any] = {
+    Severity.CRITICAL: st.error,
+    Severity.ERROR:    st.error,
+    Severity.WARNING:  st.warning,
+    Severity.INFO:     st.info,
 }
 
+# Constituants affichés dans la carte formulation (ordre d'affichage)
+_MAIN_COMPONENTS: Tuple[str, ...] = (
+    "Ciment", "Laitier", "CendresVolantes",
+    "Eau", "Superplastifiant",
+)
+
+# Dispatch sévérité → (méthode Streamlit, emoji), résolu en une seule lookup
+_SEVERITY_STYLE: Dict[Severity, Tuple[Callable, str]] = {
+    sev: (_SEVERITY_ST_FN[sev], _SEVERITY_EMOJIS[sev])
+    for sev in Severity
+}
+
+# Bandeau affiché quand la formulation ne déclenche aucune alerte
+_NO_ALERT_MSG = "Aucune alerte — Formulation conforme"
+
 # Ordre de tri des sévérités (CRITICAL en premier)
 _SEVERITY_ORDER: Dict[Severity, int] = {
     Severity.CRITICAL: 0,
@@ -57,11 +88,183 @@ _SEVERITY_ORDER: Dict[Severity, int] = {
     Severity.INFO:     3,
 }
 
+# st.fragment n'existe qu'à partir de Streamlit 1.37 (requirements : 1.31) :
+# sans lui, les boutons d'action restent exécutés dans le rerun de la page
+_HAS_FRAGMENT = hasattr(st, "fragment")
+_fragment = st.fragment if _HAS_FRAGMENT else (lambda f: f)
+
+# st.html n'existe qu'à partir de Streamlit 1.37 : repli sur st.markdown
+_HAS_ST_HTML = hasattr(st, "html")
+
+
+# Tables d'échappement HTML (un seul passage str.translate, mêmes entités
+# que html.escape avec et sans quote)
+_HTML_ESCAPE_TEXT = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+_HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;",
+})
+
+# Motifs du convertisseur Markdown simplifié (compilés une fois)
+_MD_BOLD_RE   = re.compile(r"\*\*(.+?)\*\*")
+_MD_ITALIC_RE = re.compile(r"\*(.+?)\*")
+_MD_META_RE   = re.compile(r"[\*\-•\n]")
+_BULLET_FIRST_CHARS = frozenset("*-•")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEMPLATES HTML (construits une fois à l'import)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Carte métrique — mise en forme portée par les classes .metric-card-* de
+# apply_custom_theme() ; seule la couleur de la carte est passée en variable CSS.
+_METRIC_CARD_TMPL = """
+    <div class="custom-metric-card" style="--card-color:{card_color};--card-bg1:{card_color}18;--card-bg2:{card_color}06">
+        <div class="metric-card-row">
+            <div class="metric-card-body">
+                <div class="metric-card-title">{icon} {title}</div>
+                <div class="metric-card-value">
+                    {value_str}<span class="metric-card-unit">{unit}</span>{delta_html}
+                </div>
+            </div>
+            <div class="metric-card-emoji">{grade_emoji}</div>
+        </div>
+    </div>
+    """
+
+# Corps de la carte formulation : composition | prédictions en grille CSS
+_FORMULATION_BODY_TMPL = """
+            <div style="
+                display: grid;
+                grid-template-columns: 1fr 1fr;
+                gap: 1rem;
+                padding: 0.75rem 0;
+                font-size: 0.875rem;
+            ">
+                <div>
+                    <strong>📦 Composition</strong>
+                    <div style="opacity: 0.7; margin-top: 0.3rem;">{composition_lines}</div>
+                </div>
+                <div>
+                    <strong>🎯 Prédictions</strong>
+                    <div style="opacity: 0.7; margin-top: 0.3rem;">
+                        💪 Résistance : <strong>{resistance:.1f}</strong> MPa<br>
+                        🧂 Diffusion Cl⁻ : <strong>{diffusion:.2f}</strong> ×10⁻¹²<br>
+                        🌫️ Carbonatation : <strong>{carbonatation:.1f}</strong> mm
+                    </div>
+                </div>
+            </div>
+            """
+
+# Ligne « classe exigée → classe atteinte | score » du verdict
+_VERDICT_ROW_TMPL = """
+    <div style="
+        display: grid;
+        grid-template-columns: 2fr 0.4fr 2fr 2fr;
+        gap: 1rem;
+        align-items: start;
+        color: {dark};
+        margin: 0.5rem 0 1rem 0;
+    ">
+        <div title="Classe d'exposition imposée par l'environnement du projet (EN 206)">
+            <div style="font-size: 0.875rem; opacity: 0.75;">📋 Classe Exigée</div>
+            <div style="font-size: 2.25rem; line-height: 1.2;">{required}</div>
+        </div>
+        <div style="text-align: center; font-size: 1.8rem; padding-top: 1.4rem;">→</div>
+        <div title="Classe réellement atteinte par la formulation (moteur EN 206)">
+            <div style="font-size: 0.875rem; opacity: 0.75;">🎯 Classe Atteinte</div>
+            <div style="font-size: 2.25rem; line-height: 1.2;">{achieved}</div>
+            <div style="font-size: 0.875rem; color: {delta_color};">{delta_text}</div>
+        </div>
+        <div title="Score calculé sur les alertes (CRITICAL=-40, ERROR=-20, WARNING=-8)">
+            <div style="font-size: 0.875rem; opacity: 0.75;">Score Conformité</div>
+            <div style="font-size: 2.25rem; line-height: 1.2;">{score_str}</div>
+            <div style="font-size: 0.875rem; opacity: 0.6;">
+                Classe résistance : <strong>{res_class}</strong>
+            </div>
+        </div>
+    </div>
+    """
+
+# Encadré info_box — couleur, icône, titre et corps HTML substitués par appel
+_INFO_BOX_TMPL = """
+        <div style="
+            background: {color}12;
+            border-left: 4px solid {color};
+            border-radius: 8px;
+            padding: 1.2rem 1.4rem;
+            margin: 1rem 0;
+            line-height: 1.65;
+        ">
+            <div style="
+                display: flex;
+                align-items: center;
+                gap: 0.7rem;
+                margin-bottom: 0.8rem;
+            ">
+                <span style="font-size: 1.5rem;">{icon}</span>
+                <h4 style="
+                    margin: 0;
+                    color: {color};
+                    font-weight: 600;
+                    font-size: 1.05rem;
+                ">{title}</h4>
+            </div>
+            <div style="color: {dark}; font-size: 0.95rem;">
+                {body}
+            </div>
+        </div>
+        """
+
+# Variation (delta) — couleur et flèche figées à l'import, seule la valeur varie
+_DELTA_POS_TMPL = (
+    f'<span style="color:{_SUCCESS}; '
+    f'font-size:0.85rem; margin-left:0.5rem;">↑ {{v:.1f}}</span>'
+)
+_DELTA_NEG_TMPL = (
+    f'<span style="color:{_DANGER}; '
+    f'font-size:0.85rem; margin-left:0.5rem;">↓ {{v:.1f}}</span>'
+)
+
+# En-tête de la carte formulation
+_FORMULATION_HEADER_TMPL = """
+            <div style="
+                background: {primary};
+                color: white;
+                padding: 0.75rem 1rem;
+                border-radius: 8px 8px 0 0;
+                font-weight: 600;
+                font-size: 1rem;
+            ">
+                🧪 {name}
+            </div>
+            """
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # HELPERS PRIVÉS
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def _escape(text: str) -> str:
+    """Échappe `text` pour insertion HTML (équivalent de html.escape)."""
+    return text.translate(_HTML_ESCAPE_TABLE)
+
+
+def _render_html(body: str) -> None:
+    """
+    Affiche un bloc HTML via `st.html`, ou via `st.markdown` si absent.
+
+    Pour le repli Markdown, les lignes sont désindentées et les lignes vides
+    retirées : un HTML indenté de 4 espaces serait sinon rendu en bloc de code.
+    """
+    if _HAS_ST_HTML:
+        st.html(body)
+    else:
+        st.markdown(
+            "\n".join(filter(None, map(str.strip, body.splitlines()))),
+            unsafe_allow_html=True,
+        )
+
+
 def _format_value(value: float) -> str:
     """
     Formate un nombre flottant de façon lisible.
@@ -77,20 +280,35 @@ def _format_value(value: float) -> str:
     Returns:
         Chaîne formatée
     """
+    # NaN ≠ NaN : jamais de hit dans lru_cache, on le traite hors cache
+    if value != value:
+        return "NaN"
+    return _format_value_cached(value)
+
+
+@lru_cache(maxsize=1024)
+def _format_value_cached(value: float) -> str:
+    """Corps mémoïsé de `_format_value` (valeurs non NaN)."""
     abs_v = abs(value)
-    if abs_v >= 1_000:
-        return f"{value:,.1f}"
-    if abs_v >= 10:
-        return f"{value:.1f}"
-    return f"{value:.2f}"
+    spec = ",.1f" if abs_v >= 1_000 else (".1f" if abs_v >= 10 else ".2f")
+    return format(value, spec)
+
 
+def _inline_markdown(text: str) -> str:
+    """Applique **gras** puis *italique* à un fragment de ligne."""
+    return _MD_ITALIC_RE.sub(r"<em>\1</em>", _MD_BOLD_RE.sub(r"<strong>\1</strong>", text))
 
+
+@lru_cache(maxsize=256)
 def _simple_markdown_to_html(text: str) -> str:
     """
     Convertit un sous-ensemble de Markdown en HTML sans dépendance externe.
 
     Gère : **gras**, *italique*, listes à puces (• ou -), sauts de ligne.
 
+    Résultat mémoïsé (LRU borné à 256 textes) : `info_box` est presque
+    toujours appelé avec des contenus constants, reconvertis à chaque rerun.
+
     Args:
         text: Texte Markdown simplifié
 
@@ -98,49 +316,130 @@ def _simple_markdown_to_html(text: str) -> str:
         HTML sécurisé (entités HTML échappées avant transformation)
     """
     # 1. Échapper les caractères HTML dangereux (XSS)
-    escaped = html_stdlib.escape(text, quote=False)
+    escaped = text.translate(_HTML_ESCAPE_TEXT)
+
+    # Chemin rapide : texte brut sur une ligne, sans métacaractère Markdown
+    if not _MD_META_RE.search(escaped):
+        stripped = escaped.strip()
+        return f"<p style='margin: 0.2rem 0;'>{stripped}</p>" if stripped else "<br>"
 
     # 2. Blocs de liste : lignes commençant par •, - ou *
-    lines = escaped.split("\n")
-    html_lines: List[str] = []
+    #    Gras / italique appliqués ligne par ligne à l'écriture (pas de
+    #    repasse regex sur le texte complet, pas de liste intermédiaire)
+    buf   = io.StringIO()
+    write = buf.write
+    sep   = ""
     in_list = False
 
-    for line in lines:
+    for line in escaped.split("\n"):
         stripped = line.strip()
-        is_bullet = re.match(r"^[\*\-•]\s+(.+)$", stripped)
+        # Puce = marqueur (*, - ou •) suivi d'un blanc : tests str en C,
+        # sans regex (même règle que l'ancien motif ^[\*\-•]\s+(.+)$)
+        is_bullet = (
+            stripped[:1] in _BULLET_FIRST_CHARS
+            and stripped[1:2].isspace()
+        )
 
         if is_bullet:
             if not in_list:
-                html_lines.append("<ul style='margin: 0.4rem 0 0.4rem 1.2rem; padding: 0;'>")
+                write(f"{sep}<ul style='margin: 0.4rem 0 0.4rem 1.2rem; padding: 0;'>")
+                sep = "\n"
                 in_list = True
-            html_lines.append(f"<li>{is_bullet.group(1)}</li>")
+            write(f"{sep}<li>{_inline_markdown(stripped[1:].lstrip())}</li>")
         else:
             if in_list:
-                html_lines.append("</ul>")
+                write(f"{sep}</ul>")
                 in_list = False
             if stripped:
-                html_lines.append(f"<p style='margin: 0.2rem 0;'>{stripped}</p>")
+                write(f"{sep}<p style='margin: 0.2rem 0;'>{_inline_markdown(stripped)}</p>")
             else:
-                html_lines.append("<br>")
+                write(f"{sep}<br>")
+        sep = "\n"
 
     if in_list:
-        html_lines.append("</ul>")
+        write(f"{sep}</ul>")
+
+    return buf.getvalue()
 
-    result = "\n".join(html_lines)
 
-    # 3. **gras**
-    result = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", result)
+@lru_cache(maxsize=512)
+def _formulation_header_html(name: str) -> str:
+    """En-tête HTML d'une carte formulation (mémoïsé par nom)."""
+    return _FORMULATION_HEADER_TMPL.format(
+        primary=_PRIMARY,
+        name=_escape(name),
+    )
+
+
+@lru_cache(maxsize=512)
+def _composition_caption_lines(items: Tuple[Tuple[str, float], ...]) -> Tuple[str, ...]:
+    """
+    Lignes « constituant : dosage » d'une carte formulation.
+
+    Mémoïsé sur le tuple normalisé (constituant, dosage arrondi) : dans les
+    vues listes, les mêmes formulations sont réaffichées à chaque rerun.
 
-    # 4. *italique*
-    result = re.sub(r"\*(.+?)\*", r"<em>\1</em>", result)
+    Args:
+        items: Paires (constituant, dosage) dans l'ordre d'affichage
 
-    return result
+    Returns:
+        Lignes HTML des constituants non nuls
+    """
+    return tuple(
+        f"• {comp} : <strong>{val:.1f}</strong> kg/m³"
+        for comp, val in items
+        if val > 0
+    )
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # METRIC CARD
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@st.cache_data(max_entries=256, show_spinner=False)
+def _build_metric_html(
+    title:         str,
+    value:         float,
+    unit:          str,
+    delta:         Optional[float],
+    icon:          str,
+    quality_grade: Optional[str],
+) -> str:
+    """
+    Construit le HTML d'une carte métrique (mis en cache par paramètres).
+
+    Returns:
+        HTML prêt pour `st.html()`
+    """
+    # ── Couleur et emoji selon grade ────────────────────────────────────────
+    if quality_grade and quality_grade in _GRADE_COLOR:
+        card_color  = _GRADE_COLOR[quality_grade]
+        grade_emoji = STATUS_EMOJI.get(quality_grade, "")
+    else:
+        card_color  = _PRIMARY
+        grade_emoji = ""
+
+    # ── Formatage de la valeur ──────────────────────────────────────────────
+    value_str = _format_value(value)
+
+    # ── Delta (variation) ───────────────────────────────────────────────────
+    delta_html = ""
+    if delta is not None:
+        tmpl = _DELTA_POS_TMPL if delta >= 0 else _DELTA_NEG_TMPL
+        delta_html = tmpl.format(v=abs(delta))
+
+    # ── HTML de la carte ────────────────────────────────────────────────────
+    return _METRIC_CARD_TMPL.format_map({
+        "card_color":  card_color,
+        "icon":        icon,
+        "title":       _escape(title),
+        "value_str":   value_str,
+        "unit":        _escape(unit),
+        "delta_html":  delta_html,
+        "grade_emoji": grade_emoji,
+    })
+
+
 def metric_card(
     title:         str,
     value:         float,
@@ -154,9 +453,12 @@ def metric_card(
     """
     Carte métrique stylisée avec couleur dynamique selon le grade qualité.
 
-    Signature v1.0.0 (propre, sans détection d'ordre d'arguments) :
+    Signature v1.0.0 :
         metric_card(title, value, unit, delta, icon, help_text, quality_grade, key)
 
+    Forme héritée tolérée : metric_card(title, value, unit, icon, ...) — un
+    `delta` de type str est interprété comme l'icône.
+
     Args:
         title        : Libellé de la métrique (ex: "Résistance")
         value        : Valeur numérique à afficher
@@ -178,79 +480,11 @@ def metric_card(
         )
         ```
     """
-    # ── Couleur et emoji selon grade ────────────────────────────────────────
-    if quality_grade and quality_grade in QUALITY_THRESHOLDS:
-        color_key  = QUALITY_THRESHOLDS[quality_grade].get("color", "primary")
-        card_color = COLOR_PALETTE.get(color_key, COLOR_PALETTE["primary"])
-        grade_emoji = STATUS_EMOJI.get(quality_grade, "")
-    else:
-        card_color  = COLOR_PALETTE["primary"]
-        grade_emoji = ""
+    # Forme héritée : l'icône arrive en 4e position (une seule sonde)
+    if isinstance(delta, str):
+        icon, delta = delta, None
 
-    # ── Formatage de la valeur ──────────────────────────────────────────────
-    value_str = _format_value(value)
-
-    # ── Delta (variation) ───────────────────────────────────────────────────
-    delta_html = ""
-    if delta is not None and isinstance(delta, (int, float)):
-        delta_color  = COLOR_PALETTE.get("success", "#27ae60") if delta >= 0 \
-                       else COLOR_PALETTE.get("danger", "#e74c3c")
-        delta_symbol = "↑" if delta >= 0 else "↓"
-        delta_html = (
-            f'<span style="color:{delta_color}; font-size:0.85rem; margin-left:0.5rem;">'
-            f'{delta_symbol} {abs(delta):.1f}'
-            f'</span>'
-        )
-
-    # ── HTML de la carte ────────────────────────────────────────────────────
-    card_html = f"""
-    <div class="custom-metric-card" style="
-        background: linear-gradient(135deg, {card_color}18 0%, {card_color}06 100%);
-        border-left: 4px solid {card_color};
-        border-radius: 8px;
-        padding: 1.2rem;
-        margin-bottom: 1rem;
-        box-shadow: 0 3px 10px rgba(0,0,0,0.07);
-        transition: transform 0.2s ease, box-shadow 0.2s ease;
-    ">
-        <div style="display: flex; align-items: center; justify-content: space-between;">
-            <div style="flex: 1;">
-                <div style="
-                    color: {UI_SETTINGS['colors']['dark']};
-                    font-size: 0.88rem;
-                    margin-bottom: 0.35rem;
-                    opacity: 0.75;
-                    letter-spacing: 0.02em;
-                ">
-                    {icon} {html_stdlib.escape(title)}
-                </div>
-                <div style="
-                    color: {card_color};
-                    font-size: 2.2rem;
-                    font-weight: 700;
-                    line-height: 1.1;
-                ">
-                    {value_str}
-                    <span style="font-size: 1rem; font-weight: 400; opacity: 0.85; margin-left: 0.2rem;">
-                        {html_stdlib.escape(unit)}
-                    </span>
-                    {delta_html}
-                </div>
-            </div>
-            <div style="font-size: 2.8rem; opacity: 0.2; margin-left: 0.5rem;">
-                {grade_emoji}
-            </div>
-        </div>
-    </div>
-    <style>
-        .custom-metric-card:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 7px 18px rgba(0,0,0,0.11);
-        }}
-    </style>
-    """
-
-    st.html(card_html)
+    _render_html(_build_metric_html(title, value, unit, delta, icon, quality_grade))
 
     # ── Aide contextuelle ───────────────────────────────────────────────────
     if help_text:
@@ -258,6 +492,7 @@ def metric_card(
             st.caption(help_text)
 
 
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # FORMULATION CARD
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -295,70 +530,71 @@ def formulation_card(
     """
     with st.container():
 
-        # ── Header ──────────────────────────────────────────────────────────
-        st.markdown(
-            f"""
-            <div style="
-                background: {COLOR_PALETTE['primary']};
-                color: white;
-                padding: 0.75rem 1rem;
-                border-radius: 8px 8px 0 0;
-                font-weight: 600;
-                font-size: 1rem;
-            ">
-                🧪 {html_stdlib.escape(name)}
-            </div>
-            """,
-            unsafe_allow_html=True,
+        # ── Header + corps : une seule grille HTML (pas de st.columns) ───────
+        get = composition.get
+        items = tuple(
+            (comp, round(float(get(comp, 0.0)), 4))
+            for comp in _MAIN_COMPONENTS
+        )
+        lines = list(_composition_caption_lines(items))
+        if "Ratio_E_L" in predictions:
+            lines.append(f"• Ratio E/L : <strong>{predictions['Ratio_E_L']:.3f}</strong>")
+
+        _render_html(
+            _formulation_header_html(name)
+            + _FORMULATION_BODY_TMPL.format(
+                composition_lines="<br>".join(lines),
+                resistance=predictions.get("Resistance", 0.0),
+                diffusion=predictions.get("Diffusion_Cl", 0.0),
+                carbonatation=predictions.get("Carbonatation", 0.0),
+            )
         )
-
-        # ── Corps ───────────────────────────────────────────────────────────
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.markdown("**📦 Composition**")
-            _MAIN_COMPONENTS = [
-                "Ciment", "Laitier", "CendresVolantes",
-                "Eau", "Superplastifiant",
-            ]
-            for comp in _MAIN_COMPONENTS:
-                val = composition.get(comp, 0.0)
-                if val > 0:
-                    st.caption(f"• {comp} : **{val:.1f}** kg/m³")
-
-            if "Ratio_E_L" in predictions:
-                st.caption(f"• Ratio E/L : **{predictions['Ratio_E_L']:.3f}**")
-
-        with col2:
-            st.markdown("**🎯 Prédictions**")
-            resistance    = predictions.get("Resistance", 0.0)
-            diffusion     = predictions.get("Diffusion_Cl", 0.0)
-            carbonatation = predictions.get("Carbonatation", 0.0)
-
-            st.caption(f"💪 Résistance : **{resistance:.1f}** MPa")
-            st.caption(f"🧂 Diffusion Cl⁻ : **{diffusion:.2f}** ×10⁻¹²")
-            st.caption(f"🌫️ Carbonatation : **{carbonatation:.1f}** mm")
 
         # ── Actions ─────────────────────────────────────────────────────────
         if show_actions:
-            st.markdown("---")
-            col_a, col_b, col_c = st.columns(3)
+            _formulation_actions(name, composition, predictions, on_select)
 
-            with col_a:
-                if st.button("📊 Analyser", key=f"analyze_{name}",
-                             use_container_width=True):
-                    if on_select:
-                        on_select(composition, predictions)
 
-            with col_b:
-                if st.button("⭐ Favori", key=f"fav_{name}",
-                             use_container_width=True):
-                    st.toast(f"⭐ {name} ajouté aux favoris")
+@_fragment
+def _formulation_actions(
+    name:        str,
+    composition: Dict[str, float],
+    predictions: Dict[str, float],
+    on_select:   Optional[Callable],
+) -> None:
+    """
+    Boutons d'action d'une carte formulation, isolés dans un fragment.
 
-            with col_c:
-                if st.button("📥 Export", key=f"export_{name}",
-                             use_container_width=True):
-                    st.toast("📥 Export en cours…")
+    Favori / Export ne réexécutent que ce fragment, pas la page entière (ni
+    les autres cartes). Après `on_select`, la page entière est relancée pour
+    refléter l'état qu'il a modifié, comme avant l'isolation en fragment.
+    Sans st.fragment (Streamlit < 1.37), le clic relance déjà toute la page.
+    """
+    # Clés compactes : CRC32 du nom (déterministe, contrairement à hash() qui
+    # varie entre processus). 32 bits suffisent pour l'unicité sur une page.
+    kid = f"{zlib.crc32(name.encode('utf-8')):08x}"
+    k_analyze, k_fav, k_export = f"a{kid}", f"f{kid}", f"e{kid}"
+
+    st.markdown("---")
+    col_a, col_b, col_c = st.columns(3)
+
+    with col_a:
+        if st.button("📊 Analyser", key=k_analyze,
+                     use_container_width=True):
+            if on_select:
+                on_select(composition, predictions)
+                if _HAS_FRAGMENT:
+                    st.rerun()
+
+    with col_b:
+        if st.button("⭐ Favori", key=k_fav,
+                     use_container_width=True):
+            st.toast(f"⭐ {name} ajouté aux favoris")
+
+    with col_c:
+        if st.button("📥 Export", key=k_export,
+                     use_container_width=True):
+            st.toast("📥 Export en cours…")
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -386,51 +622,95 @@ def alert_banner(
         ```
     """
     if not alerts:
-        st.success("Aucune alerte — Formulation conforme")
+        st.success(_NO_ALERT_MSG)
         return
 
-    # Tri par sévérité décroissante
-    sorted_alerts = sorted(
-        alerts,
-        key=lambda a: _SEVERITY_ORDER.get(a.severity, 9),
-    )
+    # Tri par sévérité décroissante (decorate-sort-undecorate : clés calculées
+    # une fois en C, l'index garantit la stabilité sans comparer les alertes)
+    ranks = map(_SEVERITY_ORDER.__getitem__, map(attrgetter("severity"), alerts))
+    sorted_alerts = [a for _, _, a in sorted(zip(ranks, count(), alerts))]
 
-    displayed = sorted_alerts[:max_display]
-    hidden    = sorted_alerts[max_display:]
+    n_hidden = len(sorted_alerts) - max_display
 
     st.markdown(f"### 🚨 Alertes de Validation ({len(alerts)})")
 
-    for alert in displayed:
-        sev_val  = alert.severity.value
-        emoji    = _SEVERITY_EMOJIS.get(sev_val, "•")
-        st_fn    = _SEVERITY_ST_FN.get(sev_val, st.info)
-
-        # Message structuré (pas de f-string trop long)
-        parts = [
-            f"**{emoji} {alert.category}**\n\n",
-            alert.message,
-            f"\n\n💡 **Recommandation** : {alert.recommendation}",
-        ]
-        if alert.norm_ref:
-            parts.append(f"\n\n📖 *Norme : {alert.norm_ref}*")
+    for alert in islice(sorted_alerts, max_display):
+        st_fn, emoji = _SEVERITY_STYLE[alert.severity]
 
-        st_fn("".join(parts))
+        norm = f"\n\n📖 *Norme : {alert.norm_ref}*" if alert.norm_ref else ""
+        st_fn(
+            f"**{emoji} {alert.category}**\n\n{alert.message}"
+            f"\n\n💡 **Recommandation** : {alert.recommendation}{norm}"
+        )
 
     # Alertes masquées
-    if hidden:
-        with st.expander(f"➕ Afficher {len(hidden)} alerte(s) supplémentaire(s)"):
-            for alert in hidden:
-                sev_val = alert.severity.value
-                emoji   = _SEVERITY_EMOJIS.get(sev_val, "•")
-                st.caption(
-                    f"{emoji} **{alert.category}** : {alert.message}"
-                )
+    if n_hidden > 0:
+        # Texte construit d'un bloc : un seul élément dans l'expander
+        hidden_caption = "  \n".join(
+            f"{_SEVERITY_STYLE[a.severity][1]} **{a.category}** : {a.message}"
+            for a in islice(sorted_alerts, max_display, None)
+        )
+        with st.expander(f"➕ Afficher {n_hidden} alerte(s) supplémentaire(s)"):
+            st.caption(hidden_caption)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # VERDICT CARD (NOUVEAU — aligné avec ValidationReport v1.0.0)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@lru_cache(maxsize=128)
+def _verdict_payload(
+    is_valid:         bool,
+    compliant:        bool,
+    required_class:   Optional[str],
+    achieved_class:   Optional[str],
+    compliance_score: float,
+    resistance_class: Optional[str],
+) -> Tuple[str, str, str, str, str, str, str, str, str]:
+    """
+    Textes affichés par `verdict_card`, mémoïsés sur les champs du rapport.
+
+    Returns:
+        (type bandeau, message, icône, classe exigée, classe atteinte,
+         texte delta, couleur CSS du delta, score formaté, classe de résistance)
+    """
+    if not is_valid:
+        banner = (
+            "error",
+            "🚨 **INVALIDE** — La formulation contient au moins une alerte CRITICAL. "
+            "Elle est physiquement inutilisable en l'état.",
+            "🚨",
+        )
+    elif compliant:
+        banner = (
+            "success",
+            "**CONFORME** — La formulation satisfait les exigences EN 206.",
+            "✅",
+        )
+    else:
+        banner = (
+            "error",
+            "❌ **NON CONFORME** — La formulation ne satisfait pas la classe d'exposition exigée.",
+            "❌",
+        )
+
+    delta_text  = "✅ Conforme" if compliant else "❌ Insuffisant"
+    delta_color = _SUCCESS      if compliant else _DANGER
+
+    score     = compliance_score
+    color_dot = "🟢" if score >= 80 else ("🟡" if score >= 60 else "🔴")
+
+    return (
+        *banner,
+        required_class or "—",
+        achieved_class or "—",
+        delta_text,
+        delta_color,
+        f"{color_dot} {score:.0f} / 100",
+        resistance_class or "N/A",
+    )
+
+
 def verdict_card(report: ValidationReport) -> None:
     """
     Affiche un bandeau de verdict contractuel complet à partir d'un ValidationReport.
@@ -452,64 +732,31 @@ def verdict_card(report: ValidationReport) -> None:
         verdict_card(report)
         ```
     """
-    # ── Bandeau verdict ─────────────────────────────────────────────────────
-    if not report.is_valid:
-        st.error(
-            "🚨 **INVALIDE** — La formulation contient au moins une alerte CRITICAL. "
-            "Elle est physiquement inutilisable en l'état.",
-            icon="🚨",
-        )
-    elif report.compliance_with_required:
-        st.success(
-            f"**CONFORME** — La formulation satisfait les exigences EN 206.",
-            icon="✅",
-        )
-    else:
-        st.error(
-            f"❌ **NON CONFORME** — La formulation ne satisfait pas la classe d'exposition exigée.",
-            icon="❌",
-        )
-
-    # ── Comparaison Classe Exigée → Classe Atteinte ─────────────────────────
-    required = report.required_class or "—"
-    achieved = report.achieved_class or "—"
-
-    col_req, col_arrow, col_ach, col_score = st.columns([2, 0.4, 2, 2])
-
-    with col_req:
-        st.metric(
-            label="📋 Classe Exigée",
-            value=required,
-            help="Classe d'exposition imposée par l'environnement du projet (EN 206)",
-        )
-
-    with col_arrow:
-        st.markdown(
-            "<div style='text-align:center; font-size:1.8rem; padding-top:1.4rem;'>→</div>",
-            unsafe_allow_html=True,
-        )
-
-    with col_ach:
-        delta_text  = "✅ Conforme" if report.compliance_with_required else "❌ Insuffisant"
-        delta_color = "normal"      if report.compliance_with_required else "inverse"
-        st.metric(
-            label="🎯 Classe Atteinte",
-            value=achieved,
-            delta=delta_text,
-            delta_color=delta_color,
-            help="Classe réellement atteinte par la formulation (moteur EN 206)",
-        )
+    (banner_kind, banner_msg, banner_icon,
+     required, achieved, delta_text, delta_color,
+     score_str, res_class) = _verdict_payload(
+        report.is_valid,
+        report.compliance_with_required,
+        report.required_class,
+        report.achieved_class,
+        report.compliance_score,
+        report.resistance_class,
+    )
 
-    with col_score:
-        score     = report.compliance_score
-        color_dot = "🟢" if score >= 80 else ("🟡" if score >= 60 else "🔴")
-        res_class = report.resistance_class or "N/A"
-        st.metric(
-            label="Score Conformité",
-            value=f"{color_dot} {score:.0f} / 100",
-            help="Score calculé sur les alertes (CRITICAL=-40, ERROR=-20, WARNING=-8)",
-        )
-        st.caption(f"Classe résistance : **{res_class}**")
+    # ── Bandeau verdict ─────────────────────────────────────────────────────
+    banner_fn = st.success if banner_kind == "success" else st.error
+    banner_fn(banner_msg, icon=banner_icon)
+
+    # ── Comparaison Classe Exigée → Classe Atteinte (un seul élément) ───────
+    _render_html(_VERDICT_ROW_TMPL.format_map({
+        "required":    _escape(required),
+        "achieved":    _escape(achieved),
+        "delta_text":  delta_text,
+        "delta_color": delta_color,
+        "score_str":   score_str,
+        "res_class":   _escape(res_class),
+        "dark":        _DARK,
+    }))
 
     # ── Note de surperformance ───────────────────────────────────────────────
     if (
@@ -559,46 +806,22 @@ def info_box(
         )
         ```
     """
-    color_value = COLOR_PALETTE.get(color, COLOR_PALETTE["primary"])
+    color_value = COLOR_PALETTE.get(color, _PRIMARY)
 
     # Sécurité : forcer string
     if not isinstance(content, str):
         content = str(content)
 
-    # Conversion Markdown → HTML (sans dépendance externe)
+    # Conversion Markdown → HTML (sans dépendance externe, mémoïsée)
     html_content = _simple_markdown_to_html(content.strip())
 
-    st.markdown(
-        f"""
-        <div style="
-            background: {color_value}12;
-            border-left: 4px solid {color_value};
-            border-radius: 8px;
-            padding: 1.2rem 1.4rem;
-            margin: 1rem 0;
-            line-height: 1.65;
-        ">
-            <div style="
-                display: flex;
-                align-items: center;
-                gap: 0.7rem;
-                margin-bottom: 0.8rem;
-            ">
-                <span style="font-size: 1.5rem;">{icon}</span>
-                <h4 style="
-                    margin: 0;
-                    color: {color_value};
-                    font-weight: 600;
-                    font-size: 1.05rem;
-                ">{html_stdlib.escape(title)}</h4>
-            </div>
-            <div style="color: {UI_SETTINGS['colors']['dark']}; font-size: 0.95rem;">
-                {html_content}
-            </div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    _render_html(_INFO_BOX_TMPL.format_map({
+        "color": color_value,
+        "icon":  icon,
+        "title": _escape(title),
+        "body":  html_content,
+        "dark":  _DARK,
+    }))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
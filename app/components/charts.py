@@ -7,21 +7,183 @@ Version: 1.0.0
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
+import functools
+import inspect
+import warnings
+
 import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+import plotly.io as pio
+from plotly.colors import qualitative as _qualitative
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 import logging
 
 from config.settings import UI_SETTINGS
-from config.constants import COLOR_PALETTE, LABELS_MAP
+from config.constants import (
+    BOUNDS, COLOR_PALETTE, LABELS_MAP, MATERIALS_COST_EURO_KG, QUALITY_THRESHOLDS
+)
 from app.core.analyzer import SensitivityResult
 
 logger = logging.getLogger(__name__)
 
+# Au-delà de ce nombre de points, les traces sont sous-échantillonnées
+MAX_PLOT_POINTS = 2000
+
+# Au-delà de ce nombre de points, rendu WebGL (Scattergl) au lieu de SVG
+WEBGL_THRESHOLD = 5000
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# HELPERS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _figure_cache(maxsize: int = 128):
+    """
+    Mémoïse une fonction de tracé pure `f(mapping, *args) -> go.Figure`.
+
+    Clé : (items du dict dans l'ordre d'insertion, autres arguments).
+    L'ordre fait partie de la clé car il fixe l'ordre des parts, des
+    couleurs et de la légende.
+
+    Le cache stocke la figure sérialisée en JSON, sans le template par
+    défaut (réappliqué à la reconstruction, dont il est le coût dominant) :
+    chaque appel renvoie une Figure neuve, modifiable sans effet sur les
+    appels suivants. Les appels avec des arguments non hashables (ex: dict
+    de seuils personnalisé) passent hors cache.
+    """
+    def decorator(build):
+        signature = inspect.signature(build)
+        params = list(signature.parameters.values())[1:]
+        defaults = tuple(p.default for p in params)
+        # Nombre minimal d'arguments positionnels couvrant les paramètres sans défaut
+        n_required = 1 + max(
+            (i + 1 for i, p in enumerate(params) if p.default is p.empty), default=0
+        )
+        n_max = 1 + len(params)
+
+        @functools.lru_cache(maxsize=maxsize)
+        def cached_json(items, *args):
+            fig = build(dict(items), *args)
+            fig.layout.template = None
+            return fig.to_json()
+
+        @functools.wraps(build)
+        def wrapper(*args, **kwargs):
+            if not kwargs and n_required <= len(args) <= n_max:
+                # Appel positionnel (cas courant) : défauts complétés sans bind()
+                mapping, rest = args[0], (*args[1:], *defaults[len(args) - 1:])
+            else:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                mapping, *rest = bound.args
+            key = (tuple(mapping.items()), *rest)
+            try:
+                hash(key)
+            except TypeError:
+                return build(mapping, *rest)
+            return pio.from_json(cached_json(*key))
+
+        wrapper.cache_clear = cached_json.cache_clear
+        wrapper.cache_info = cached_json.cache_info
+        return wrapper
+
+    return decorator
+
+
+def scatter_cls(n_points: int):
+    """
+    Classe de trace adaptée au volume : `go.Scattergl` (GPU) au-delà de
+    WEBGL_THRESHOLD points, `go.Scatter` (SVG) sinon.
+
+    `n_points` est la taille de la série source, avant `lttb_indices` :
+    après sous-échantillonnage elle ne dépasse jamais MAX_PLOT_POINTS
+    (< WEBGL_THRESHOLD) et la bascule WebGL ne se ferait jamais.
+    """
+    return go.Scattergl if n_points > WEBGL_THRESHOLD else go.Scatter
+
+
+def lttb_indices(x, y, n_out: int = MAX_PLOT_POINTS) -> np.ndarray:
+    """
+    Indices des points retenus par Largest-Triangle-Three-Buckets (LTTB).
+
+    Conserve la forme visuelle d'une courbe (pics, creux) avec `n_out`
+    points, pour alléger le JSON envoyé au navigateur et le rendu Plotly.
+
+    Args:
+        x: Abscisses croissantes (numériques ou datetime64)
+        y: Ordonnées
+        n_out: Nombre de points à conserver
+
+    Returns:
+        Indices triés (tous les indices si len(x) <= n_out)
+    """
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype('int64')
+    x = x.astype(np.float64, copy=False)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
 
+    # Bornes des n_out - 2 seaux intérieurs (premier et dernier points fixes)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        nxt_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:nxt_end].mean()
+        avg_y = y[end:nxt_end].mean()
+
+        # Aire du triangle (point retenu précédent, candidat, moyenne suivante)
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        idx[i + 1] = a
+
+    return idx
+
+
+def _display_indices(n: int, max_points: int) -> np.ndarray:
+    """
+    Indices quasi équidistants réduisant un axe de `n` points à `max_points`
+    (premier et dernier inclus). Simple sélection, sans interpolation.
+    """
+    if n <= max_points:
+        return np.arange(n)
+    return np.linspace(0, n - 1, max_points).round().astype(np.intp)
+
+
+def _surface_xyz(X: np.ndarray, Y: np.ndarray, Z: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Tableaux allégés pour une trace Surface/Contour.
+
+    Z en float32 (précision d'affichage largement suffisante, moitié moins
+    de données sérialisées). Pour une grille rectilinéaire (meshgrid),
+    X et Y sont réduits à leurs axes 1D au lieu de deux matrices N×N.
+    """
+    X, Y = np.asarray(X), np.asarray(Y)
+    z = np.asarray(Z).astype(np.float32, copy=False)
+    if X.ndim == 2 and (X == X[:1, :]).all() and (Y == Y[:, :1]).all():
+        return X[0, :], Y[:, 0], z
+    return X, Y, z
+
+
+# Constituants affichés dans le camembert
+_PIE_KEYS = frozenset({
+    'Ciment', 'Laitier', 'CendresVolantes', 'Eau',
+    'Superplastifiant', 'GravilonsGros', 'SableFin'
+})
+
+
+@_figure_cache()
 def plot_composition_pie(
     composition: Dict[str, float],
     title: str = "Composition du Béton"
@@ -41,8 +203,7 @@ def plot_composition_pie(
     data = {
         LABELS_MAP.get(k, k): v
         for k, v in composition.items()
-        if v > 0 and k in ['Ciment', 'Laitier', 'CendresVolantes', 'Eau',
-                           'Superplastifiant', 'GravilonsGros', 'SableFin']
+        if k in _PIE_KEYS and v > 0
     }
     
     fig = go.Figure(data=[go.Pie(
@@ -50,20 +211,18 @@ def plot_composition_pie(
         values=list(data.values()),
         hole=0.4,
         marker=dict(
-            colors=px.colors.qualitative.Set3,
+            colors=_qualitative.Set3,
             line=dict(color='white', width=2)
         ),
         textinfo='label+percent',
         textposition='outside',
         hovertemplate='<b>%{label}</b><br>%{value:.1f} kg/m³<br>%{percent}<extra></extra>'
-    )])
-    
-    fig.update_layout(
+    )], layout=dict(
         title=dict(text=title, font=dict(size=16, color=COLOR_PALETTE['primary'])),
         showlegend=True,
         height=400,
         margin=dict(t=50, b=30, l=30, r=30)
-    )
+    ))
     
     return fig
 
@@ -90,40 +249,66 @@ def plot_parallel_coordinates(
     ]
     
     available_cols = [c for c in key_cols if c in formulations_df.columns]
-    df_plot = formulations_df[available_cols].copy()
-    
-    # Normaliser pour affichage
-    dimensions = []
-    for col in df_plot.columns:
-        dimensions.append(dict(
+    df_plot = formulations_df[available_cols]  # lecture seule : pas de copie
+    
+    # Au-delà du seuil, échantillon stratifié sur les déciles de la couleur
+    # (Parcoords envoie et redessine chaque ligne côté navigateur)
+    max_rows = UI_SETTINGS['parcoords_max_rows']
+    if len(df_plot) > max_rows:
+        frac = max_rows / len(df_plot)
+        if color_by in available_cols:
+            # Codes de déciles (NaN → groupe -1, conservé dans l'échantillon)
+            deciles = pd.qcut(df_plot[color_by], 10, labels=False, duplicates='drop').fillna(-1)
+            df_plot = df_plot.groupby(deciles).sample(frac=frac, random_state=0)
+        else:
+            df_plot = df_plot.sample(frac=frac, random_state=0)
+    
+    # Une seule extraction ndarray ; bornes de toutes les colonnes d'un coup
+    mat = df_plot.to_numpy(dtype=np.float64)
+    col_min = np.nanmin(mat, axis=0)
+    col_max = np.nanmax(mat, axis=0)
+    
+    dimensions = [
+        dict(
             label=LABELS_MAP.get(col, col),
-            values=df_plot[col],
-            range=[df_plot[col].min(), df_plot[col].max()]
-        ))
+            values=mat[:, idx],
+            range=[col_min[idx], col_max[idx]]
+        )
+        for idx, col in enumerate(available_cols)
+    ]
+    
+    if color_by in available_cols:
+        c_idx = available_cols.index(color_by)
+        line_color, cmin, cmax = mat[:, c_idx], col_min[c_idx], col_max[c_idx]
+    else:
+        line_color, cmin, cmax = mat[:, 0], 0, 100
     
     fig = go.Figure(data=go.Parcoords(
         line=dict(
-            color=df_plot[color_by] if color_by in df_plot.columns else df_plot.iloc[:, 0],
+            color=line_color,
             colorscale='Viridis',
             showscale=True,
-            cmin=df_plot[color_by].min() if color_by in df_plot.columns else 0,
-            cmax=df_plot[color_by].max() if color_by in df_plot.columns else 100
+            cmin=cmin,
+            cmax=cmax
         ),
         dimensions=dimensions
-    ))
-    
-    fig.update_layout(
+    ), layout=dict(
         title="Comparaison Multi-Paramètres",
         height=500,
         margin=dict(t=50, b=30, l=100, r=100)
-    )
+    ))
     
     return fig
 
 
+# Couleurs des sous-graphiques de sensibilité (une par cible, dans l'ordre)
+_SENSITIVITY_COLORS = (COLOR_PALETTE['primary'], COLOR_PALETTE['success'], COLOR_PALETTE['warning'])
+
+
 def plot_sensitivity(
     sensitivity_result: SensitivityResult,
-    targets: Optional[List[str]] = None
+    targets: Optional[List[str]] = None,
+    max_points: int = MAX_PLOT_POINTS
 ) -> go.Figure:
     """
     Graphique d'analyse de sensibilité.
@@ -131,11 +316,15 @@ def plot_sensitivity(
     Args:
         sensitivity_result: Résultat SensitivityResult
         targets: Cibles à afficher (None = toutes)
+        max_points: Points max par trace (LTTB au-delà)
     
     Returns:
         Figure Plotly
     """
     
+    # plotly.subplots (~80 ms) n'est chargé qu'au premier graphique de sensibilité
+    from plotly.subplots import make_subplots
+    
     if targets is None:
         targets = list(sensitivity_result.impacts.keys())
     
@@ -151,33 +340,41 @@ def plot_sensitivity(
         vertical_spacing=0.12
     )
     
-    colors = [COLOR_PALETTE['primary'], COLOR_PALETTE['success'], COLOR_PALETTE['warning']]
+    # Une seule matrice (cibles × points) : conversion et baselines en un appel
+    impacts = np.array([sensitivity_result.impacts[t] for t in targets], dtype=np.float64)
+    baselines = impacts[:, n_points // 2].tolist()
     
-    for i, target in enumerate(targets, start=1):
-        values = sensitivity_result.impacts[target]
-        elasticity = sensitivity_result.elasticities.get(target, 0)
+    # Traces accumulées puis ajoutées en un seul add_traces (une validation de fig.data)
+    traces = []
+    
+    for i, (target, values) in enumerate(zip(targets, impacts)):
+        keep = lttb_indices(param_values, values, max_points)
         
-        fig.add_trace(
-            go.Scatter(
-                x=param_values,
-                y=values,
+        traces.append(
+            scatter_cls(n_points)(
+                x=param_values[keep],
+                y=values[keep],
                 mode='lines+markers',
                 name=LABELS_MAP.get(target, target),
-                line=dict(color=colors[i-1], width=3),
+                line=dict(color=_SENSITIVITY_COLORS[i], width=3),
                 marker=dict(size=6),
                 hovertemplate=(
                     f'<b>{sensitivity_result.parameter_name}</b>: %{{x:.1f}}<br>'
                     f'<b>{LABELS_MAP.get(target, target)}</b>: %{{y:.2f}}<br>'
                     '<extra></extra>'
                 )
-            ),
-            row=i,
-            col=1
+            )
         )
+    
+    fig.add_traces(traces, rows=list(range(1, len(traces) + 1)), cols=1)
+    
+    # Baselines après les traces : add_hline ignore les sous-graphiques vides
+    for i, (target, baseline) in enumerate(zip(targets, baselines), start=1):
+        elasticity = sensitivity_result.elasticities.get(target, 0)
         
         # Ligne baseline
         fig.add_hline(
-            y=values[n_points // 2],
+            y=baseline,
             line_dash="dash",
             line_color="gray",
             annotation_text=f"Baseline (Élasticité: {elasticity:.2f})",
@@ -199,6 +396,23 @@ def plot_sensitivity(
     return fig
 
 
+# Axes du radar : (clé, libellé, origine, étendue, inversé)
+#   inversé = False → min(100, (v - origine) / étendue × 100)
+#   inversé = True  → max(0, 100 - (v - origine) / étendue × 100)  (moins = mieux)
+_RADAR_AXES: Tuple[Tuple[str, str, float, float, bool], ...] = (
+    ("Resistance",    "Résistance",               0.0, 60.0, False),  # 0-60 MPa
+    ("Diffusion_Cl",  "Résistance Chlorures",     0.0, 20.0, True),   # 0 = excellent, 20 = faible
+    ("Carbonatation", "Résistance Carbonatation", 0.0, 40.0, True),
+    ("Ratio_E_L",     "Compacité (E/L)",          0.3, 0.4,  True),   # 0.3 = excellent, 0.7 = faible
+)
+_RADAR_KEYS    = tuple(a[0] for a in _RADAR_AXES)
+_RADAR_LABELS  = tuple(a[1] for a in _RADAR_AXES)
+_RADAR_OFFSETS = np.array([a[2] for a in _RADAR_AXES])
+_RADAR_SPANS   = np.array([a[3] for a in _RADAR_AXES])
+_RADAR_INVERT  = np.array([a[4] for a in _RADAR_AXES])
+
+
+@_figure_cache()
 def plot_performance_radar(
     predictions: Dict[str, float],
     thresholds: Optional[Dict[str, Dict[str, float]]] = None,
@@ -216,56 +430,31 @@ def plot_performance_radar(
         Figure Plotly
     """
     
-    from config.constants import QUALITY_THRESHOLDS
-    
     if thresholds is None:
         thresholds = QUALITY_THRESHOLDS
     
-    # Normalisation (0-100)
-    categories = []
-    values = []
-    
-    # Résistance (0-100 MPa → 0-100%)
-    if 'Resistance' in predictions:
-        categories.append("Résistance")
-        values.append(min(100, predictions['Resistance'] / 60 * 100))
-    
-    # Diffusion Cl⁻ (inversé : moins = mieux)
-    if 'Diffusion_Cl' in predictions:
-        categories.append("Résistance Chlorures")
-        diff_cl = predictions['Diffusion_Cl']
-        # 0 = excellent (100%), 20 = faible (0%)
-        values.append(max(0, 100 - (diff_cl / 20 * 100)))
-    
-    # Carbonatation (inversé)
-    if 'Carbonatation' in predictions:
-        categories.append("Résistance Carbonatation")
-        carb = predictions['Carbonatation']
-        values.append(max(0, 100 - (carb / 40 * 100)))
-    
-    # Ratio E/L (inversé)
-    if 'Ratio_E_L' in predictions:
-        categories.append("Compacité (E/L)")
-        el = predictions['Ratio_E_L']
-        # 0.3 = excellent (100%), 0.7 = faible (0%)
-        values.append(max(0, 100 - ((el - 0.3) / 0.4 * 100)))
+    # Normalisation (0-100) vectorisée sur les axes présents
+    present = np.array([k in predictions for k in _RADAR_KEYS])
+    raw = np.array([predictions.get(k, 0.0) for k in _RADAR_KEYS], dtype=np.float64)
+    
+    pct = (raw - _RADAR_OFFSETS) / _RADAR_SPANS * 100
+    norm = np.clip(np.where(_RADAR_INVERT, 100 - pct, pct), 0, 100)
+    
+    categories = [label for label, keep in zip(_RADAR_LABELS, present) if keep]
+    values = norm[present].tolist()
     
     # Fermer le radar
     categories.append(categories[0])
     values.append(values[0])
     
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatterpolar(
+    fig = go.Figure(data=go.Scatterpolar(
         r=values,
         theta=categories,
         fill='toself',
         name=name,
         line=dict(color=COLOR_PALETTE['primary'], width=2),
         marker=dict(size=8)
-    ))
-    
-    fig.update_layout(
+    ), layout=dict(
         polar=dict(
             radialaxis=dict(
                 visible=True,
@@ -277,11 +466,17 @@ def plot_performance_radar(
         title=f"Performance Globale - {name}",
         showlegend=False,
         height=450
-    )
+    ))
     
     return fig
 
 
+# Prix matériaux par défaut, alignés une fois pour le calcul vectoriel des coûts
+_COST_MATERIALS = tuple(MATERIALS_COST_EURO_KG)
+_COST_UNIT_VEC = np.array([MATERIALS_COST_EURO_KG[m] for m in _COST_MATERIALS], dtype=np.float64)
+
+
+@_figure_cache()
 def plot_cost_breakdown(
     composition: Dict[str, float],
     material_costs: Optional[Dict[str, float]] = None
@@ -297,23 +492,24 @@ def plot_cost_breakdown(
         Figure Plotly
     """
     
-    from config.constants import MATERIALS_COST_EURO_KG
-    
     if material_costs is None:
-        material_costs = MATERIALS_COST_EURO_KG
-    
-    # Calcul coûts
-    costs = {}
-    total_cost = 0
-    
-    for material, quantity in composition.items():
-        if material in material_costs and quantity > 0:
-            cost = quantity * material_costs[material]
-            costs[LABELS_MAP.get(material, material)] = cost
-            total_cost += cost
-    
-    # Trier par coût décroissant
-    sorted_costs = dict(sorted(costs.items(), key=lambda x: x[1], reverse=True))
+        materials, unit_costs = _COST_MATERIALS, _COST_UNIT_VEC
+    else:
+        materials = tuple(material_costs)
+        unit_costs = np.fromiter(material_costs.values(), dtype=np.float64, count=len(materials))
+    
+    # Calcul coûts : quantités alignées sur les prix, produit terme à terme
+    quantities = np.fromiter((composition.get(m, 0.0) for m in materials), dtype=np.float64, count=len(materials))
+    present = np.flatnonzero(quantities > 0)
+    costs = quantities[present] * unit_costs[present]
+    total_cost = float(costs.sum())
+    
+    # Trier par coût décroissant (tri stable : ex æquo dans l'ordre des prix)
+    order = np.argsort(-costs, kind='stable')
+    sorted_costs = {
+        LABELS_MAP.get(materials[present[k]], materials[present[k]]): costs[k]
+        for k in order.tolist()
+    }
     
     fig = go.Figure(data=[go.Bar(
         x=list(sorted_costs.keys()),
@@ -327,21 +523,16 @@ def plot_cost_breakdown(
         text=[f"{v:.2f} €" for v in sorted_costs.values()],
         textposition='outside',
         hovertemplate='<b>%{x}</b><br>Coût: %{y:.2f} €/m³<extra></extra>'
-    )])
-    
-    fig.update_layout(
+    )], layout=dict(
         title=f"Répartition des Coûts (Total: {total_cost:.2f} €/m³)",
         xaxis_title="Matériau",
         yaxis_title="Coût (€/m³)",
         height=400,
         showlegend=False
-    )
+    ))
     
     return fig
 
-import warnings
-from typing import Tuple
-import numpy as np
 
 # Import du moteur expert
 try:
@@ -412,38 +603,38 @@ def generate_response_surface_data(
     # FALLBACK : Méthode legacy (si nouveau moteur non disponible)
     # ═══════════════════════════════════════════════════════════
     else:
-        from config.constants import BOUNDS
-        from app.core.predictor import predict_concrete_properties
+        from app.core.predictor import composition_grid, predict_batch, TARGETS_ORDER
         
         x_range = np.linspace(BOUNDS[param1]['min'], BOUNDS[param1]['max'], n_points)
         y_range = np.linspace(BOUNDS[param2]['min'], BOUNDS[param2]['max'], n_points)
         
         X, Y = np.meshgrid(x_range, y_range)
-        Z = np.zeros_like(X)
         
-        for i in range(n_points):
-            for j in range(n_points):
-                composition = baseline.copy()
-                composition[param1] = float(X[i, j])
-                composition[param2] = float(Y[i, j])
-                
-                try:
-                    if target == 'CO2':
-                        # Support CO₂ même en mode legacy
-                        from app.core.co2_calculator import CO2Calculator
-                        co2_calc = CO2Calculator()
-                        co2_result = co2_calc.calculate(composition, cement_type)
-                        Z[i, j] = co2_result.co2_total_kg_m3
-                    else:
-                        preds = predict_concrete_properties(
-                            composition=composition,
-                            model=model,
-                            feature_list=feature_list,
-                            validate=False
-                        )
-                        Z[i, j] = preds[target]
-                except:
-                    Z[i, j] = np.nan
+        if target == 'CO2':
+            # Support CO₂ même en mode legacy
+            from app.core.co2_calculator import CO2Calculator
+            co2_calc = CO2Calculator()
+            Z = np.zeros_like(X)
+            
+            for i in range(n_points):
+                for j in range(n_points):
+                    composition = baseline.copy()
+                    composition[param1] = float(X[i, j])
+                    composition[param2] = float(Y[i, j])
+                    
+                    try:
+                        Z[i, j] = co2_calc.calculate(composition, cement_type).co2_total_kg_m3
+                    except Exception:
+                        Z[i, j] = np.nan
+        else:
+            # Toute la grille en un seul model.predict()
+            grid = composition_grid(baseline, param1, param2, X, Y)
+            
+            try:
+                z = predict_batch(grid, model)[:, TARGETS_ORDER.index(target)]
+                Z = np.where(np.isfinite(z), z, np.nan).reshape(X.shape)
+            except Exception:
+                Z = np.full(X.shape, np.nan)
         
         return X, Y, Z
 
@@ -469,19 +660,22 @@ def plot_response_surface_3d(
     Returns:
         Figure Plotly
     """
-    from config.constants import LABELS_MAP
+    # Libellés résolus une fois pour titres, axes et hovertemplates
+    l1, l2, lt = (LABELS_MAP.get(k, k) for k in (param1, param2, target))
+    
+    x_s, y_s, z_s = _surface_xyz(X, Y, Z)
+    z_min, z_max = np.nanmin(Z), np.nanmax(Z)
     
     fig = go.Figure(data=[go.Surface(
-        x=X,
-        y=Y,
-        z=Z,
+        x=x_s,
+        y=y_s,
+        z=z_s,
         colorscale='Viridis',
         colorbar=dict(
-            title=LABELS_MAP.get(target, target),
-            titleside='right',
+            title=dict(text=lt, side='right'),
             tickmode='linear',
-            tick0=np.nanmin(Z),
-            dtick=(np.nanmax(Z) - np.nanmin(Z)) / 5
+            tick0=z_min,
+            dtick=(z_max - z_min) / 5
         ),
         contours=dict(
             z=dict(
@@ -492,27 +686,24 @@ def plot_response_surface_3d(
             )
         ),
         hovertemplate=(
-            f'<b>{LABELS_MAP.get(param1, param1)}</b>: %{{x:.1f}}<br>'
-            f'<b>{LABELS_MAP.get(param2, param2)}</b>: %{{y:.1f}}<br>'
-            f'<b>{LABELS_MAP.get(target, target)}</b>: %{{z:.2f}}<br>'
+            f'<b>{l1}</b>: %{{x:.1f}}<br>'
+            f'<b>{l2}</b>: %{{y:.1f}}<br>'
+            f'<b>{lt}</b>: %{{z:.2f}}<br>'
             '<extra></extra>'
         )
-    )])
-    
-    # Mise en page
-    fig.update_layout(
-        title=title or f"Surface de Reponse 3D: {LABELS_MAP.get(target, target)}",
+    )], layout=dict(
+        title=title or f"Surface de Reponse 3D: {lt}",
         scene=dict(
-            xaxis_title=LABELS_MAP.get(param1, param1) + " (kg/m³)",
-            yaxis_title=LABELS_MAP.get(param2, param2) + " (kg/m³)",
-            zaxis_title=LABELS_MAP.get(target, target),
+            xaxis_title=l1 + " (kg/m³)",
+            yaxis_title=l2 + " (kg/m³)",
+            zaxis_title=lt,
             camera=dict(
                 eye=dict(x=1.5, y=1.5, z=1.3)
             )
         ),
         height=600,
         margin=dict(l=0, r=0, b=0, t=40)
-    )
+    ))
     
     return fig
 
@@ -524,7 +715,8 @@ def plot_contour_2d(
     param1: str,
     param2: str,
     target: str,
-    title: Optional[str] = None
+    title: Optional[str] = None,
+    display_resolution: int = 40
 ) -> go.Figure:
     """
     Carte de contours 2D (vue de dessus).
@@ -534,16 +726,30 @@ def plot_contour_2d(
         param1, param2: Noms paramètres
         target: Nom cible
         title: Titre custom
+        display_resolution: Points max par axe envoyés au navigateur
+            (l'optimum reste cherché sur la grille complète)
     
     Returns:
         Figure Plotly
     """
-    from config.constants import LABELS_MAP
+    # Libellés résolus une fois pour titres, axes et hovertemplates
+    l1, l2, lt = (LABELS_MAP.get(k, k) for k in (param1, param2, target))
+    
+    x_axis, y_axis, z_disp = X[0, :], Y[:, 0], np.asarray(Z)
+    
+    # Grille dense → maillage d'affichage réduit (sélection de lignes et
+    # colonnes quasi équidistantes, bords inclus pour garder le domaine) :
+    # Plotly recalcule les isolignes côté client à chaque zoom. Aucune
+    # interpolation : les cellules NaN ne débordent pas sur leurs voisines.
+    if max(z_disp.shape) > display_resolution:
+        rows, cols = (_display_indices(n, display_resolution) for n in z_disp.shape)
+        z_disp = z_disp[np.ix_(rows, cols)]
+        x_axis, y_axis = x_axis[cols], y_axis[rows]
     
     fig = go.Figure(data=go.Contour(
-        x=X[0, :],
-        y=Y[:, 0],
-        z=Z,
+        x=x_axis,
+        y=y_axis,
+        z=z_disp.astype(np.float32, copy=False),
         colorscale='Viridis',
         contours=dict(
             showlabels=True,
@@ -553,13 +759,12 @@ def plot_contour_2d(
             )
         ),
         colorbar=dict(
-            title=LABELS_MAP.get(target, target),
-            titleside='right'
+            title=dict(text=lt, side='right')
         ),
         hovertemplate=(
-            f'<b>{LABELS_MAP.get(param1, param1)}</b>: %{{x:.1f}}<br>'
-            f'<b>{LABELS_MAP.get(param2, param2)}</b>: %{{y:.1f}}<br>'
-            f'<b>{LABELS_MAP.get(target, target)}</b>: %{{z:.2f}}<br>'
+            f'<b>{l1}</b>: %{{x:.1f}}<br>'
+            f'<b>{l2}</b>: %{{y:.1f}}<br>'
+            f'<b>{lt}</b>: %{{z:.2f}}<br>'
             '<extra></extra>'
         )
     ))
@@ -583,17 +788,17 @@ def plot_contour_2d(
         name='Optimal',
         hovertemplate=(
             f'<b>OPTIMAL</b><br>'
-            f'{LABELS_MAP.get(param1, param1)}: {optimal_x:.1f}<br>'
-            f'{LABELS_MAP.get(param2, param2)}: {optimal_y:.1f}<br>'
-            f'{LABELS_MAP.get(target, target)}: {optimal_z:.2f}<br>'
+            f'{l1}: {optimal_x:.1f}<br>'
+            f'{l2}: {optimal_y:.1f}<br>'
+            f'{lt}: {optimal_z:.2f}<br>'
             '<extra></extra>'
         )
     ))
     
     fig.update_layout(
-        title=title or f"Carte de Contours: {LABELS_MAP.get(target, target)}",
-        xaxis_title=LABELS_MAP.get(param1, param1) + " (kg/m³)",
-        yaxis_title=LABELS_MAP.get(param2, param2) + " (kg/m³)",
+        title=title or f"Carte de Contours: {lt}",
+        xaxis_title=l1 + " (kg/m³)",
+        yaxis_title=l2 + " (kg/m³)",
         height=500,
         showlegend=True
     )
@@ -620,15 +825,19 @@ def plot_3d_scatter_formulations(
     Returns:
         Figure Plotly
     """
-    from config.constants import LABELS_MAP
+    # Libellés résolus une fois pour titres, axes et hovertemplates
+    l1, l2, lt = (LABELS_MAP.get(k, k) for k in (param1, param2, target))
     
     if names is None:
         names = [f"Form. {i+1}" for i in range(len(formulations))]
     
-    # Extraire données
-    x_vals = [f[param1] for f in formulations]
-    y_vals = [f[param2] for f in formulations]
-    z_vals = [f[target] for f in formulations]
+    # Extraire données : une colonne ndarray par axe (sérialisée en buffer
+    # typé par Plotly, bien plus rapide qu'une liste de floats Python)
+    n = len(formulations)
+    x_vals, y_vals, z_vals = (
+        np.fromiter((f[key] for f in formulations), dtype=np.float64, count=n)
+        for key in (param1, param2, target)
+    )
     
     fig = go.Figure(data=[go.Scatter3d(
         x=x_vals,
@@ -640,7 +849,7 @@ def plot_3d_scatter_formulations(
             color=z_vals,
             colorscale='Viridis',
             showscale=True,
-            colorbar=dict(title=LABELS_MAP.get(target, target)),
+            colorbar=dict(title=lt),
             line=dict(width=1, color='white')
         ),
         text=names,
@@ -648,53 +857,67 @@ def plot_3d_scatter_formulations(
         textfont=dict(size=10),
         hovertemplate=(
             '<b>%{text}</b><br>'
-            f'{LABELS_MAP.get(param1, param1)}: %{{x:.1f}}<br>'
-            f'{LABELS_MAP.get(param2, param2)}: %{{y:.1f}}<br>'
-            f'{LABELS_MAP.get(target, target)}: %{{z:.2f}}<br>'
+            f'{l1}: %{{x:.1f}}<br>'
+            f'{l2}: %{{y:.1f}}<br>'
+            f'{lt}: %{{z:.2f}}<br>'
             '<extra></extra>'
         )
-    )])
-    
-    fig.update_layout(
-        title=f"Comparaison 3D: {LABELS_MAP.get(target, target)}",
+    )], layout=dict(
+        title=f"Comparaison 3D: {lt}",
         scene=dict(
-            xaxis_title=LABELS_MAP.get(param1, param1),
-            yaxis_title=LABELS_MAP.get(param2, param2),
-            zaxis_title=LABELS_MAP.get(target, target)
+            xaxis_title=l1,
+            yaxis_title=l2,
+            zaxis_title=lt
         ),
         height=600
-    )
+    ))
     
     return fig
 
 
 def plot_heatmap_correlation(
-    data: dict[str, list[float]],
-    title: str = "Matrice de Correlation"
+    data: Union[Dict[str, List[float]], np.ndarray],
+    title: str = "Matrice de Correlation",
+    labels: Optional[Sequence[str]] = None,
+    show_values: bool = True
 ) -> go.Figure:
     """
     Heatmap de corrélation entre paramètres.
     
     Args:
-        data: Dict {nom_param: [valeurs]}
+        data: Dict {nom_param: [valeurs]} ou matrice de corrélation
+            déjà calculée (np.ndarray carrée, ex. np.corrcoef)
         title: Titre graphique
+        labels: Noms des paramètres si `data` est une matrice
+        show_values: Afficher les coefficients dans les cellules
     
     Returns:
         Figure Plotly
     """
-    import pandas as pd
-    
-    df = pd.DataFrame(data)
-    corr_matrix = df.corr()
+    if isinstance(data, np.ndarray):
+        corr = data
+        names = list(labels) if labels is not None else [str(i) for i in range(corr.shape[0])]
+    else:
+        # Une ligne par paramètre : np.corrcoef sans passer par un DataFrame,
+        # sauf valeurs manquantes (corrélation par paires complètes de pandas)
+        names = list(data.keys())
+        arr = np.array(list(data.values()), dtype=np.float64)
+        if np.isfinite(arr).all():
+            corr = np.corrcoef(arr)
+        else:
+            corr = pd.DataFrame(arr.T, columns=names).corr().to_numpy()
+    
+    # float32 suffit à l'affichage et divise par deux le tableau sérialisé
+    corr = np.asarray(corr).astype(np.float32, copy=False)
     
     fig = go.Figure(data=go.Heatmap(
-        z=corr_matrix.values,
-        x=corr_matrix.columns,
-        y=corr_matrix.columns,
+        z=corr,
+        x=names,
+        y=names,
         colorscale='RdBu',
         zmid=0,
-        text=corr_matrix.values,
-        texttemplate='%{text:.2f}',
+        # Le template lit z directement : pas de matrice `text` dupliquée
+        texttemplate='%{z:.2f}' if show_values else None,
         textfont=dict(size=10),
         colorbar=dict(title="Correlation"),
         hovertemplate=(
@@ -702,19 +925,21 @@ def plot_heatmap_correlation(
             'Correlation: %{z:.3f}<br>'
             '<extra></extra>'
         )
-    ))
-    
-    fig.update_layout(
+    ), layout=dict(
         title=title,
         xaxis_title="",
         yaxis_title="",
         height=500,
         width=600
-    )
+    ))
     
     return fig
 
 __all__ = [
+    'MAX_PLOT_POINTS',
+    'WEBGL_THRESHOLD',
+    'scatter_cls',
+    'lttb_indices',
     'plot_composition_pie',
     'plot_parallel_coordinates',
     'plot_sensitivity',
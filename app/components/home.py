@@ -0,0 +1,105 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+MODULE: app/components/home.py
+Description: Blocs HTML statiques de la page d'accueil (header, cartes, footer)
+Auteur: Stage R&D - IMT Nord Europe
+Version: 1.0.0
+═══════════════════════════════════════════════════════════════════════════════
+
+Ces blocs ne dépendent que de constantes (APP_SETTINGS, COLOR_PALETTE).
+Ils sont donc formatés une seule fois à l'import du module, au lieu d'être
+reconstruits à chaque rerun de app.py (le script principal est réexécuté
+en entier à chaque interaction, contrairement aux modules importés).
+"""
+
+from config.settings import APP_SETTINGS
+from config.constants import COLOR_PALETTE
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# HEADER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+HEADER_HTML = f"""
+    <div style="text-align: center; padding: 2rem 0;">
+        <h1 style="font-size: 3rem; color: {COLOR_PALETTE['primary']}; margin: 0;">
+            {APP_SETTINGS['app_icon']} {APP_SETTINGS['app_name']}
+        </h1>
+        <p style="font-size: 1.2rem; color: {COLOR_PALETTE['secondary']}; margin-top: 0.5rem;">
+            Intelligence Artificielle pour la Formulation du Béton
+        </p>
+        <hr style="width: 50%; margin: 1.5rem auto; border: none; border-top: 3px solid {COLOR_PALETTE['accent']};">
+    </div>
+    """
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CARTES "DÉMARRAGE RAPIDE"
+# ═══════════════════════════════════════════════════════════════════════════════
+
+CARD_FORMULATEUR_HTML = """
+        <div style="background: linear-gradient(135deg, #1e3c7215 0%, #1e3c7205 100%);
+                    border-left: 4px solid #1e3c72;
+                    padding: 1.5rem;
+                    border-radius: 8px;">
+            <h4 style="margin-top: 0;">📊 Formulateur</h4>
+            <p>Saisissez votre composition et obtenez instantanément les prédictions
+            de résistance, diffusion des chlorures et carbonatation.</p>
+        </div>
+        """
+
+CARD_LABO_HTML = """
+        <div style="background: linear-gradient(135deg, #9c27b015 0%, #9c27b005 100%);
+                    border-left: 4px solid #9c27b0;
+                    padding: 1.5rem;
+                    border-radius: 8px;">
+            <h4 style="margin-top: 0;">🧪 Laboratoire</h4>
+            <p>Analysez la sensibilité paramétrique et étudiez l'impact
+            de chaque composant sur les propriétés du béton.</p>
+        </div>
+        """
+
+CARD_COMPARATEUR_HTML = """
+        <div style="background: linear-gradient(135deg, #ff7f0e15 0%, #ff7f0e05 100%);
+                    border-left: 4px solid #ff7f0e;
+                    padding: 1.5rem;
+                    border-radius: 8px;">
+            <h4 style="margin-top: 0;">⚖️ Comparateur</h4>
+            <p>Comparez jusqu'à 10 formulations côte à côte pour
+            identifier la plus adaptée à vos besoins.</p>
+        </div>
+        """
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FOOTER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+FOOTER_HTML = f"""
+    <div style="text-align: center; padding: 2rem 0; color: #6c757d;">
+        <p>
+            <strong>{APP_SETTINGS['institution']}</strong> | {APP_SETTINGS['campus']}  <br>
+            {APP_SETTINGS['department']}
+        </p>
+        <p style="font-size: 0.9rem;">
+            📧 {APP_SETTINGS['email']} | 📞 {APP_SETTINGS['phone']}  <br>
+            🌐 <a href="{APP_SETTINGS['website']}" target="_blank" style="color: {COLOR_PALETTE['primary']};">
+                {APP_SETTINGS['website']}
+            </a>
+        </p>
+        <hr style="width: 30%; margin: 1rem auto; border: none; border-top: 1px solid #e0e0e0;">
+        <p style="font-size: 0.85rem;">
+            © 2026 IMT Nord Europe - Tous droits réservés  <br>
+            Version {APP_SETTINGS['version']} | Powered by Streamlit & XGBoost
+        </p>
+    </div>
+    """
+
+
+__all__ = [
+    'HEADER_HTML',
+    'CARD_FORMULATEUR_HTML',
+    'CARD_LABO_HTML',
+    'CARD_COMPARATEUR_HTML',
+    'FOOTER_HTML',
+]
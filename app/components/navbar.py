@@ -12,151 +12,167 @@ CORRECTIONS v2.0.0:
 ✅ Design moderne et professionnel
 """
 
+import re
+
 import streamlit as st
 from config.constants import COLOR_PALETTE
 
 
-def render_navbar(current_page: str = ""):
-    """
-    Affiche une barre de navigation horizontale moderne.
+# ═══════════════════════════════════════════════════════════════
+# CSS NAVBAR (formaté une seule fois à l'import)
+# ═══════════════════════════════════════════════════════════════
+
+_NAVBAR_CSS_TEMPLATE = """
+<style>
+    /* Container principal */
+    .navbar-container {{
+        background: linear-gradient(135deg, {primary} 0%, {secondary} 100%);
+        padding: 1rem 2rem;
+        border-radius: 12px;
+        margin-bottom: 2rem;
+        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+    }}
     
-    Args:
-        current_page: Nom de la page active (pour highlighting)
-    """
+    /* Wrapper flex */
+    .navbar-wrapper {{
+        display: flex;
+        align-items: center;
+        justify-content: space-between;
+        gap: 2rem;
+        width: 100%;
+    }}
     
-    # ═══════════════════════════════════════════════════════════
-    # CSS NAVBAR MODERNE
-    # ═══════════════════════════════════════════════════════════
+    /* Section logo + titre */
+    .navbar-brand {{
+        display: flex;
+        align-items: center;
+        gap: 12px;
+        color: white;
+        font-size: 1.4rem;
+        font-weight: 700;
+        white-space: nowrap;
+        flex-shrink: 0;
+    }}
     
-    st.markdown(f"""
-    <style>
-        /* Container principal */
-        .navbar-container {{
-            background: linear-gradient(135deg, {COLOR_PALETTE['primary']} 0%, {COLOR_PALETTE['secondary']} 100%);
-            padding: 1rem 2rem;
-            border-radius: 12px;
-            margin-bottom: 2rem;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        }}
-        
-        /* Wrapper flex */
+    .navbar-brand .icon {{
+        font-size: 2rem;
+        filter: drop-shadow(0 2px 4px rgba(0,0,0,0.2));
+    }}
+    
+    .navbar-brand .text {{
+        font-size: 1.3rem;
+        letter-spacing: 0.5px;
+    }}
+    
+    /* Section navigation */
+    .navbar-nav {{
+        display: flex;
+        align-items: center;
+        gap: 0.5rem;
+        flex-wrap: wrap;
+        flex-grow: 1;
+        justify-content: flex-end;
+    }}
+    
+    /* Style boutons Streamlit (override) */
+    .navbar-nav .stButton {{
+        margin: 0 !important;
+    }}
+    
+    .navbar-nav .stButton > button {{
+        background: rgba(255, 255, 255, 0.1) !important;
+        color: white !important;
+        border: 1px solid rgba(255, 255, 255, 0.2) !important;
+        border-radius: 8px !important;
+        padding: 0.5rem 1rem !important;
+        font-weight: 500 !important;
+        font-size: 0.95rem !important;
+        transition: all 0.3s ease !important;
+        white-space: nowrap !important;
+        height: 42px !important;
+        display: flex !important;
+        align-items: center !important;
+        gap: 6px !important;
+    }}
+    
+    .navbar-nav .stButton > button:hover {{
+        background: rgba(255, 255, 255, 0.2) !important;
+        border-color: rgba(255, 255, 255, 0.4) !important;
+        transform: translateY(-2px) !important;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.15) !important;
+    }}
+    
+    .navbar-nav .stButton > button:active,
+    .navbar-nav .stButton > button:focus {{
+        background: rgba(255, 255, 255, 0.25) !important;
+        border-color: white !important;
+        box-shadow: 0 0 0 3px rgba(255, 255, 255, 0.3) !important;
+    }}
+    
+    /* Style page active */
+    .navbar-nav .stButton.active > button {{
+        background: rgba(255, 255, 255, 0.3) !important;
+        border-color: white !important;
+        font-weight: 600 !important;
+        box-shadow: 0 0 0 2px rgba(255, 255, 255, 0.5) !important;
+    }}
+    
+    /* Responsive */
+    @media (max-width: 1200px) {{
         .navbar-wrapper {{
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            gap: 2rem;
-            width: 100%;
+            flex-direction: column;
+            gap: 1rem;
         }}
         
-        /* Section logo + titre */
         .navbar-brand {{
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            color: white;
-            font-size: 1.4rem;
-            font-weight: 700;
-            white-space: nowrap;
-            flex-shrink: 0;
-        }}
-        
-        .navbar-brand .icon {{
-            font-size: 2rem;
-            filter: drop-shadow(0 2px 4px rgba(0,0,0,0.2));
-        }}
-        
-        .navbar-brand .text {{
-            font-size: 1.3rem;
-            letter-spacing: 0.5px;
+            justify-content: center;
+            width: 100%;
         }}
         
-        /* Section navigation */
         .navbar-nav {{
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-            flex-wrap: wrap;
-            flex-grow: 1;
-            justify-content: flex-end;
-        }}
-        
-        /* Style boutons Streamlit (override) */
-        .navbar-nav .stButton {{
-            margin: 0 !important;
-        }}
-        
-        .navbar-nav .stButton > button {{
-            background: rgba(255, 255, 255, 0.1) !important;
-            color: white !important;
-            border: 1px solid rgba(255, 255, 255, 0.2) !important;
-            border-radius: 8px !important;
-            padding: 0.5rem 1rem !important;
-            font-weight: 500 !important;
-            font-size: 0.95rem !important;
-            transition: all 0.3s ease !important;
-            white-space: nowrap !important;
-            height: 42px !important;
-            display: flex !important;
-            align-items: center !important;
-            gap: 6px !important;
-        }}
-        
-        .navbar-nav .stButton > button:hover {{
-            background: rgba(255, 255, 255, 0.2) !important;
-            border-color: rgba(255, 255, 255, 0.4) !important;
-            transform: translateY(-2px) !important;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.15) !important;
-        }}
-        
-        .navbar-nav .stButton > button:active,
-        .navbar-nav .stButton > button:focus {{
-            background: rgba(255, 255, 255, 0.25) !important;
-            border-color: white !important;
-            box-shadow: 0 0 0 3px rgba(255, 255, 255, 0.3) !important;
+            justify-content: center;
+            width: 100%;
         }}
-        
-        /* Style page active */
-        .navbar-nav .stButton.active > button {{
-            background: rgba(255, 255, 255, 0.3) !important;
-            border-color: white !important;
-            font-weight: 600 !important;
-            box-shadow: 0 0 0 2px rgba(255, 255, 255, 0.5) !important;
+    }}
+    
+    @media (max-width: 768px) {{
+        .navbar-container {{
+            padding: 1rem;
         }}
         
-        /* Responsive */
-        @media (max-width: 1200px) {{
-            .navbar-wrapper {{
-                flex-direction: column;
-                gap: 1rem;
-            }}
-            
-            .navbar-brand {{
-                justify-content: center;
-                width: 100%;
-            }}
-            
-            .navbar-nav {{
-                justify-content: center;
-                width: 100%;
-            }}
+        .navbar-brand .text {{
+            font-size: 1.1rem;
         }}
         
-        @media (max-width: 768px) {{
-            .navbar-container {{
-                padding: 1rem;
-            }}
-            
-            .navbar-brand .text {{
-                font-size: 1.1rem;
-            }}
-            
-            .navbar-nav .stButton > button {{
-                font-size: 0.85rem !important;
-                padding: 0.4rem 0.8rem !important;
-            }}
+        .navbar-nav .stButton > button {{
+            font-size: 0.85rem !important;
+            padding: 0.4rem 0.8rem !important;
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    }}
+</style>
+"""
+
+# Couleurs injectées et espaces compactés une fois pour toutes : chaque rerun
+# Streamlit réémet la même chaîne, sans f-string reformatée à chaque appel
+_NAVBAR_CSS = re.sub(r"\s+", " ", _NAVBAR_CSS_TEMPLATE.format(**COLOR_PALETTE)).strip()
+
+
+def render_navbar(current_page: str = ""):
+    """
+    Affiche une barre de navigation horizontale moderne.
+    
+    Args:
+        current_page: Nom de la page active (pour highlighting)
+    """
+    
+    # ═══════════════════════════════════════════════════════════
+    # CSS NAVBAR MODERNE
+    # ═══════════════════════════════════════════════════════════
+    
+    # Feuille formatée une fois à l'import (voir _NAVBAR_CSS). Elle reste
+    # réémise à chaque rerun : Streamlit retire du DOM tout élément non
+    # redessiné, une injection unique par session perdrait le style.
+    st.markdown(_NAVBAR_CSS, unsafe_allow_html=True)
     
     # ═══════════════════════════════════════════════════════════
     # STRUCTURE NAVBAR
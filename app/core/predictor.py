@@ -57,6 +57,28 @@ MODEL_FEATURES_ORDER: List[str] = [
     'Ciment_x_LogAge',
 ] 
 
+# Sorties du modèle, dans l'ordre des colonnes de model.predict()
+TARGETS_ORDER: List[str] = ['Resistance', 'Diffusion_Cl', 'Carbonatation']
+
+# Bornes de clip et arrondi par cible (même ordre que TARGETS_ORDER)
+# [5] Borne supérieure résistance : 200 MPa (BUHP compatibles)
+_TARGET_CLIP_MIN = np.array([0.0, 0.0, 0.0])
+_TARGET_CLIP_MAX = np.array([200.0, 30.0, 100.0])
+_TARGET_DECIMALS = (2, 3, 2)
+
+# Valeurs par défaut (béton C25/30 ordinaire) pour compléter une composition.
+# Toutes les clés RAW_FEATURES doivent être présentes avant engineering.
+_DEFAULT_COMPOSITION: Dict[str, float] = {
+    'Ciment':           280.0,
+    'Laitier':            0.0,
+    'CendresVolantes':    0.0,
+    'Eau':              180.0,
+    'Superplastifiant':   0.0,
+    'GravilonsGros':   1100.0,
+    'SableFin':         750.0,
+    'Age':               28.0,
+}
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # BORNES PHYSIQUES
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -355,26 +377,15 @@ def predict_concrete_properties(
             logger.warning("[predictor] %s", warning)
 
     # ── 2. COMPLÉTION VALEURS PAR DÉFAUT ──────────────────────────────────────
-    # Les defaults correspondent à un béton C25/30 ordinaire.
-    # Toutes les clés RAW_FEATURES doivent être présentes avant engineering.
-
-    _defaults: Dict[str, float] = {
-        'Ciment':           280.0,
-        'Laitier':            0.0,
-        'CendresVolantes':    0.0,
-        'Eau':              180.0,
-        'Superplastifiant':   0.0,
-        'GravilonsGros':   1100.0,
-        'SableFin':         750.0,
-        'Age':               28.0,
-    }
-    full_composition = {**_defaults, **composition}
+
+    full_composition = {**_DEFAULT_COMPOSITION, **composition}
 
     # ── 3. LOG VÉRIFICATION feature_list ──────────────────────────────────────
     # [1] feature_list n'est plus utilisé pour la sélection finale.
     # Si fourni, on vérifie que les raw features sont couvertes.
     if feature_list is not None:
-        raw_missing = [f for f in RAW_FEATURES if f not in feature_list]
+        provided = set(feature_list)
+        raw_missing = [f for f in RAW_FEATURES if f not in provided]
         if raw_missing:
             logger.warning(
                 "[predictor] feature_list fourni ne contient pas : %s — "
@@ -451,6 +462,82 @@ def predict_concrete_properties(
     return result
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# PRÉDICTION PAR LOT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def composition_grid(
+    baseline: Dict[str, float],
+    param1: str,
+    param2: str,
+    X: np.ndarray,
+    Y: np.ndarray,
+) -> pd.DataFrame:
+    """
+    Construit les compositions d'une grille 2D (une ligne par point).
+
+    La formulation de référence est diffusée (broadcast) dans un buffer
+    unique pré-alloué, puis param1/param2 sont remplacés par les valeurs
+    aplaties de la grille — aucune boucle Python par point ni copie de dict.
+
+    Args:
+        baseline: Formulation de référence
+        param1, param2: Paramètres balayés (axes X et Y)
+        X, Y: Meshgrids de même forme
+
+    Returns:
+        DataFrame (X.size lignes), prêt pour predict_batch()
+    """
+    columns = list(baseline)
+    buffer = np.empty((X.size, len(columns)), dtype=np.float64)
+    buffer[:] = np.fromiter(baseline.values(), dtype=np.float64, count=len(columns))
+
+    grid = pd.DataFrame(buffer, columns=columns, copy=False)
+    grid[param1] = X.ravel()
+    grid[param2] = Y.ravel()
+    return grid
+
+
+def predict_batch(compositions: pd.DataFrame, model: Any) -> np.ndarray:
+    """
+    Prédit les 3 cibles pour N compositions en un seul appel model.predict().
+
+    Même pipeline que predict_concrete_properties() (complétion par défaut,
+    engineer_features, MODEL_FEATURES_ORDER, clip + arrondi) mais sans
+    validation ni construction de dict par ligne : destiné aux grilles
+    (surfaces de réponse, balayages) où l'overhead par appel domine.
+
+    Args:
+        compositions: DataFrame, une ligne par composition (colonnes RAW_FEATURES,
+                      les colonnes absentes et NaN prennent les valeurs par défaut)
+        model:        Modèle ML, model.predict(X) → array shape (n, 3)
+
+    Returns:
+        ndarray (n, 3) dans l'ordre TARGETS_ORDER
+
+    Raises:
+        RuntimeError: Si model.predict() échoue
+    """
+    # Colonnes absentes ou cellules NaN (DataFrame construit depuis des dicts
+    # hétérogènes) → valeurs par défaut, comme la complétion du cas unitaire
+    missing = {k: v for k, v in _DEFAULT_COMPOSITION.items() if k not in compositions.columns}
+    df_input = compositions.fillna(_DEFAULT_COMPOSITION).assign(**missing)
+
+    X_input = engineer_features(df_input)[MODEL_FEATURES_ORDER]
+
+    try:
+        raw_preds = np.asarray(model.predict(X_input), dtype=np.float64)
+    except Exception as exc:
+        logger.error("[predictor] model.predict() échoué (lot de %d) : %s", len(X_input), exc, exc_info=True)
+        raise RuntimeError(f"Erreur lors de la prédiction : {exc}") from exc
+
+    preds = np.clip(raw_preds[:, :3], _TARGET_CLIP_MIN, _TARGET_CLIP_MAX)
+    for k, decimals in enumerate(_TARGET_DECIMALS):
+        preds[:, k] = preds[:, k].round(decimals)
+
+    return preds
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # PRÉDICTION AVEC MÉTAKAOLIN
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -623,6 +710,8 @@ def verify_features_alignment(model: Any, log: bool = True) -> bool:
 __all__ = [
     # Fonctions principales
     'predict_concrete_properties',
+    'predict_batch',
+    'composition_grid',
     'predict_with_mk',
     'engineer_features',
     'validate_composition',
@@ -633,6 +722,7 @@ __all__ = [
     # Constantes
     'MODEL_FEATURES_ORDER',
     'RAW_FEATURES',
+    'TARGETS_ORDER',
     'BOUNDS_ERROR',
     'BOUNDS_WARNING',
 ]
\ No newline at end of file
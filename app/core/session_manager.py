@@ -132,10 +132,36 @@ def _init_model() -> None:
             st.stop()
 
 
+@st.cache_resource(show_spinner=False)
+def _shared_db_manager(db_url: str) -> Any:
+    """
+    Construit un DatabaseManager unique, partagé par toutes les sessions.
+
+    Le manager porte un ThreadedConnectionPool : le mettre en cache
+    (st.cache_resource) évite d'ouvrir un pool PostgreSQL par utilisateur.
+
+    Args:
+        db_url: URL de connexion PostgreSQL
+
+    Returns:
+        Instance DatabaseManager
+    """
+    from database.manager import DatabaseManager  # Import local : dépendance optionnelle
+
+    return DatabaseManager(
+        db_url=db_url,
+        min_connections=2,
+        max_connections=20,
+    )
+
+
 def _init_database() -> None:
     """
     Établit la connexion PostgreSQL et stocke le manager dans la session.
 
+    Le manager (et son pool de connexions) est partagé entre les sessions
+    via `_shared_db_manager()`.
+
     En cas d'échec, la connexion est mise à None (mode dégradé).
     Les fonctionnalités de sauvegarde seront désactivées mais l'app continue.
 
@@ -146,19 +172,18 @@ def _init_database() -> None:
         return  # Déjà connecté
 
     try:
-        from database.manager import DatabaseManager  # Import local : dépendance optionnelle
-
         db_url = POSTGRES_SETTINGS.get("database_url", "")
         if not db_url:
             logger.warning("POSTGRES_SETTINGS['database_url'] vide — DB ignorée")
             st.session_state["db_manager"] = None
             return
 
-        db_manager = DatabaseManager(
-            db_url=db_url,
-            min_connections=2,
-            max_connections=10,
-        )
+        db_manager = _shared_db_manager(db_url)
+        if not db_manager.is_connected:
+            # Ne pas figer un manager déconnecté pour toutes les sessions :
+            # la prochaine session retentera la connexion.
+            _shared_db_manager.clear()
+
         st.session_state["db_manager"] = db_manager
         logger.info("Connexion PostgreSQL établie : %s", db_url.split("@")[-1])  # masque les credentials
 
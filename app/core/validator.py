@@ -22,12 +22,14 @@ Utilisé pour :
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
+from bisect import bisect_right
 import logging
 
 from config.constants import (
     BOUNDS,
     EXPOSURE_CLASSES,
     QUALITY_THRESHOLDS,
+    RESISTANCE_CLASSES,
     STATUS_EMOJI,
 )
 
@@ -47,6 +49,11 @@ _EXPOSURE_CLASS_ORDER: List[str] = [
     "XF1", "XF2", "XF3", "XF4",
 ]
 
+# Classes de résistance triées par fc,cyl croissant (recherche par bisect)
+_RESISTANCE_CLASSES_SORTED = sorted(RESISTANCE_CLASSES.items(), key=lambda x: x[1]["fc_cyl"])
+_RESISTANCE_FC_CYL: Tuple[float, ...] = tuple(specs["fc_cyl"] for _, specs in _RESISTANCE_CLASSES_SORTED)
+_RESISTANCE_CLASS_NAMES: Tuple[str, ...] = tuple(name for name, _ in _RESISTANCE_CLASSES_SORTED)
+
 # Pénalités de conformité par sévérité (pas de bonus INFO → chiffre fiable)
 _COMPLIANCE_PENALTIES: Dict[str, float] = {
     "critical": 40.0,
@@ -659,17 +666,12 @@ def determine_resistance_class(resistance: float) -> str:
     Returns:
         Code de classe résistance (ex: "C35/45")
     """
-    from config.constants import RESISTANCE_CLASSES
-
-    for class_name, specs in sorted(
-        RESISTANCE_CLASSES.items(),
-        key=lambda x: x[1]["fc_cyl"],
-        reverse=True,
-    ):
-        if resistance >= specs["fc_cyl"]:
-            return class_name
+    # `not >=` couvre aussi NaN (toute comparaison est fausse)
+    if not resistance >= _RESISTANCE_FC_CYL[0]:
+        return "C12/15"  # Minimum normalisé EN 206
 
-    return "C12/15"  # Minimum normalisé EN 206
+    # Plus grande classe dont fc,cyl ≤ résistance
+    return _RESISTANCE_CLASS_NAMES[bisect_right(_RESISTANCE_FC_CYL, resistance) - 1]
 
 
 def calculate_compliance_score(alerts: List[ValidationAlert]) -> float:
@@ -23,7 +23,7 @@ import hashlib
 import pickle
 
 # IMPORTS
-from app.core.predictor import predict_concrete_properties
+from app.core.predictor import composition_grid, predict_batch, TARGETS_ORDER
 from app.core.co2_calculator import CO2Calculator
 
 logger = logging.getLogger(__name__)
@@ -156,44 +156,47 @@ class SurfaceEngine:
         )
         
         # ─────────────────────────────────────────────────────────
-        # 3. CALCUL SURFACE (VECTORISÉ PAR LIGNE)
+        # 3. CALCUL SURFACE
         # ─────────────────────────────────────────────────────────
         
-        for i in range(resolution):
-            for j in range(resolution):
-                composition = baseline.copy()
-                composition[param1] = float(X[i, j])
-                composition[param2] = float(Y[i, j])
-                
-                try:
-                    if target == 'CO2':
-                        # Calcul CO₂ direct
+        if target == 'CO2':
+            # Calcul CO₂ direct, point par point
+            for i in range(resolution):
+                for j in range(resolution):
+                    composition = baseline.copy()
+                    composition[param1] = float(X[i, j])
+                    composition[param2] = float(Y[i, j])
+                    
+                    try:
                         co2_result = self.co2_calc.calculate(composition, cement_type)
                         Z[i, j] = co2_result.co2_total_kg_m3
-                    else:
-                        # Prédiction ML
-                        preds = predict_concrete_properties(
-                            composition=composition,
-                            model=model,
-                            feature_list=feature_list,
-                            validate=False
-                        )
-                        Z[i, j] = preds[target]
-                
-                except Exception as e:
-                    logger.debug(f"Point ignoré ({i},{j}): {e}")
-                    Z[i, j] = np.nan
+                    except Exception as e:
+                        logger.debug(f"Point ignoré ({i},{j}): {e}")
+                        Z[i, j] = np.nan
+        else:
+            # Prédiction ML : toute la grille en un seul model.predict()
+            Z = self._predict_grid(baseline, param1, param2, X, Y, model, target)
         
         # ─────────────────────────────────────────────────────────
         # 4. DÉTECTION OPTIMAL
         # ─────────────────────────────────────────────────────────
         
+        # Une seule extraction des valeurs valides : min, max et optimum
+        # en sont tirés sans repasser nanmin/nanmax/nanarg* sur toute la grille
+        valid_idx = np.flatnonzero(~np.isnan(Z))
+        values = Z.ravel()[valid_idx]
+        if values.size == 0:
+            raise ValueError(f"Surface {target} entièrement invalide (NaN)")
+        
+        i_min = int(values.argmin())
+        i_max = int(values.argmax())
+        
         if target in ['Resistance']:
             # Maximiser
-            optimal_idx = np.unravel_index(np.nanargmax(Z), Z.shape)
+            optimal_idx = np.unravel_index(valid_idx[i_max], Z.shape)
         else:
             # Minimiser (Diffusion, Carbonatation, CO₂)
-            optimal_idx = np.unravel_index(np.nanargmin(Z), Z.shape)
+            optimal_idx = np.unravel_index(valid_idx[i_min], Z.shape)
         
         optimal_x = float(X[optimal_idx])
         optimal_y = float(Y[optimal_idx])
@@ -203,9 +206,9 @@ class SurfaceEngine:
         # 5. STATISTIQUES
         # ─────────────────────────────────────────────────────────
         
-        min_val = float(np.nanmin(Z))
-        max_val = float(np.nanmax(Z))
-        mean_val = float(np.nanmean(Z))
+        min_val = float(values[i_min])
+        max_val = float(values[i_max])
+        mean_val = float(values.mean())
         
         # ─────────────────────────────────────────────────────────
         # 6. RÉSULTAT
@@ -238,6 +241,37 @@ class SurfaceEngine:
         
         return surface_data
     
+    def _predict_grid(
+        self,
+        baseline: Dict[str, float],
+        param1: str,
+        param2: str,
+        X: np.ndarray,
+        Y: np.ndarray,
+        model,
+        target: str
+    ) -> np.ndarray:
+        """
+        Prédit une cible ML sur toute la grille en un seul lot.
+        
+        Une ligne par point : la formulation de référence, avec param1/param2
+        remplacés par les valeurs de la grille. Si la prédiction échoue,
+        la surface est entièrement NaN (comme un point ignoré).
+        
+        Returns:
+            Z (même forme que X)
+        """
+        grid = composition_grid(baseline, param1, param2, X, Y)
+        
+        try:
+            preds = predict_batch(grid, model)
+        except Exception as e:
+            logger.warning(f"Grille {target} ignorée: {e}")
+            return np.full(X.shape, np.nan)
+        
+        z = preds[:, TARGETS_ORDER.index(target)]
+        return np.where(np.isfinite(z), z, np.nan).reshape(X.shape)
+    
     def generate_all_surfaces(
         self,
         baseline: Dict[str, float],
@@ -382,10 +416,11 @@ def plot_surface_with_co2(
     
     for surface, (row, col) in zip(surfaces, positions):
         fig.add_trace(
+            # Grille meshgrid : axes 1D + Z float32 (charge JSON réduite)
             go.Surface(
-                x=surface.X,
-                y=surface.Y,
-                z=surface.Z,
+                x=surface.X[0, :],
+                y=surface.Y[:, 0],
+                z=surface.Z.astype(np.float32),
                 colorscale='Viridis',
                 showscale=(col == 2),
                 name=surface.target_name
@@ -375,6 +375,60 @@ def apply_custom_theme(theme: Literal["Clair", "Sombre", "Auto"] = "Clair") -> N
         animation: fadeIn 0.3s ease;
     }}
     
+    /* ─── CARTES MÉTRIQUES (app/components/cards.py) ─── */
+    .custom-metric-card {{
+        background: linear-gradient(135deg, var(--card-bg1) 0%, var(--card-bg2) 100%);
+        border-left: 4px solid var(--card-color);
+        border-radius: 8px;
+        padding: 1.2rem;
+        margin-bottom: 1rem;
+        box-shadow: 0 3px 10px rgba(0,0,0,0.07);
+        transition: transform 0.2s ease, box-shadow 0.2s ease;
+    }}
+    
+    .custom-metric-card:hover {{
+        transform: translateY(-2px);
+        box-shadow: 0 7px 18px rgba(0,0,0,0.11);
+    }}
+    
+    .metric-card-row {{
+        display: flex;
+        align-items: center;
+        justify-content: space-between;
+    }}
+    
+    .metric-card-body {{
+        flex: 1;
+    }}
+    
+    .metric-card-title {{
+        color: {UI_SETTINGS['colors']['dark']};
+        font-size: 0.88rem;
+        margin-bottom: 0.35rem;
+        opacity: 0.75;
+        letter-spacing: 0.02em;
+    }}
+    
+    .metric-card-value {{
+        color: var(--card-color);
+        font-size: 2.2rem;
+        font-weight: 700;
+        line-height: 1.1;
+    }}
+    
+    .metric-card-unit {{
+        font-size: 1rem;
+        font-weight: 400;
+        opacity: 0.85;
+        margin-left: 0.2rem;
+    }}
+    
+    .metric-card-emoji {{
+        font-size: 2.8rem;
+        opacity: 0.2;
+        margin-left: 0.5rem;
+    }}
+    
     /* ─── RESPONSIVE ─── */
     @media (max-width: 768px) {{
         h1 {{ font-size: 2rem; }}
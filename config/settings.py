@@ -207,7 +207,10 @@ UI_SETTINGS = {
         "small": "5px",
         "medium": "10px",
         "large": "15px"
-    }
+    },
+    
+    # Graphiques : lignes max envoyées à un Parcoords (échantillon stratifié au-delà)
+    "parcoords_max_rows": 5000
 }
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -334,7 +337,8 @@ CACHE_SETTINGS = {
     "cache_ttls": {
         "model_predictions": 3600,
         "formulation_history": 7200,
-        "statistics": 1800
+        "statistics": 1800,
+        "live_stats": 30          # Page d'accueil (stats + dernières prédictions)
     }
 }
 
@@ -19,6 +19,24 @@ import time
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive TCP : détecte côté client les connexions coupées (NAT, pare-feu)
+# au lieu d'attendre le timeout TCP par défaut sur une connexion morte.
+_KEEPALIVE_KWARGS: Dict[str, int] = {
+    'keepalives': 1,
+    'keepalives_idle': 30,
+    'keepalives_interval': 10,
+    'keepalives_count': 3,
+}
+
+# Délai max d'établissement d'une connexion (s) : sans lui, un hôte injoignable
+# bloque l'ouverture (pool, remplacement d'une connexion morte) jusqu'au
+# timeout TCP du système
+_CONNECT_TIMEOUT_S = 5
+
+# statement_timeout des lectures affichées à chaque rerun de l'accueil (ms) :
+# un serveur joignable mais saturé ne doit pas figer la page
+_LIVE_READ_TIMEOUT_MS = 2000
+
 
 class DatabaseManager:
     """Gestionnaire PostgreSQL ultra-robuste avec retry et logs détaillés."""
@@ -40,7 +58,9 @@ class DatabaseManager:
             self._pool = psycopg2.pool.ThreadedConnectionPool(
                 min_connections,
                 max_connections,
-                db_url
+                db_url,
+                connect_timeout=_CONNECT_TIMEOUT_S,
+                **_KEEPALIVE_KWARGS
             )
             logger.info("[DB INIT] [OK] Pool cree avec succes")
             
@@ -95,34 +115,48 @@ class DatabaseManager:
         except:
             return "***masque***"
     
+    def _get_connection(self):
+        """
+        Emprunte une connexion au pool en écartant une connexion déjà fermée.
+
+        Seul l'attribut local `conn.closed` est lu, sans aller-retour réseau :
+        il ne signale que les coupures déjà constatées par psycopg2 (échec
+        d'une requête précédente, fermeture explicite). Ce n'est pas un
+        `pool_pre_ping` : une connexion rompue mais pas encore détectée est
+        rendue telle quelle, et l'erreur apparaît à la première requête.
+        Une connexion fermée est retirée du pool et remplacée une seule fois.
+        """
+        conn = self._pool.getconn()
+        if conn.closed:
+            logger.warning("[DB POOL] Connexion morte ecartee du pool")
+            self._pool.putconn(conn, close=True)
+            conn = self._pool.getconn()
+        return conn
+    
     def _log_database_info(self):
         """Log des infos sur la base de données."""
         try:
-            conn = self._pool.getconn()
+            conn = self._get_connection()
             cursor = conn.cursor()
             
-            cursor.execute("SELECT version();")
-            version = cursor.fetchone()[0]
-            logger.info(f"PostgreSQL: {version[:50]}...")
+            # Un seul aller-retour pour les infos serveur + existence table
+            cursor.execute("""
+                SELECT
+                    version(),
+                    current_database(),
+                    current_user,
+                    EXISTS (
+                        SELECT FROM information_schema.tables 
+                        WHERE table_schema = 'public' 
+                        AND table_name = 'predictions'
+                    );
+            """)
+            version, db_name, user, table_exists = cursor.fetchone()
             
-            cursor.execute("SELECT current_database();")
-            db_name = cursor.fetchone()[0]
+            logger.info(f"PostgreSQL: {version[:50]}...")
             logger.info(f"Database: {db_name}")
-            
-            cursor.execute("SELECT current_user;")
-            user = cursor.fetchone()[0]
             logger.info(f"User: {user}")
             
-            # Vérifier table predictions
-            cursor.execute("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables 
-                    WHERE table_schema = 'public' 
-                    AND table_name = 'predictions'
-                );
-            """)
-            table_exists = cursor.fetchone()[0]
-            
             if table_exists:
                 cursor.execute("SELECT COUNT(*) FROM predictions;")
                 count = cursor.fetchone()[0]
@@ -144,7 +178,7 @@ class DatabaseManager:
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                conn = self._pool.getconn()
+                conn = self._get_connection()
                 cursor = conn.cursor()
                 cursor.execute("SELECT 1")
                 result = cursor.fetchone()
@@ -162,6 +196,55 @@ class DatabaseManager:
                     
         return False
     
+    def ping(self, timeout_ms: int = 500) -> bool:
+        """
+        Sonde rapide de disponibilité (SELECT 1).
+
+        Contrairement à `_test_connection()`, aucune nouvelle tentative :
+        destinée à être appelée souvent (ex: avant d'afficher des stats).
+
+        Bornes du temps d'attente :
+          - `timeout_ms` ne borne que l'exécution du SELECT 1 côté serveur
+            (statement_timeout) : un serveur joignable mais saturé ;
+          - l'ouverture d'une nouvelle connexion est bornée par
+            `connect_timeout` (_CONNECT_TIMEOUT_S) ;
+          - une connexion déjà ouverte vers un hôte devenu injoignable n'est
+            bornée par aucun des deux : les keep-alive TCP (_KEEPALIVE_KWARGS)
+            la détectent au repos (~60 s) et `_get_connection` l'écarte alors,
+            mais une requête déjà envoyée attend le délai de retransmission
+            TCP du système. Les appelants fréquents mettent donc le résultat
+            en cache (cf. `_db_alive` dans app.py).
+
+        Args:
+            timeout_ms: statement_timeout appliqué au SELECT 1 (ms)
+
+        Returns:
+            True si le serveur a répondu
+        """
+        if not self._pool:
+            return False
+        
+        conn = None
+        alive = False
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute("SET LOCAL statement_timeout = %s", (timeout_ms,))
+            cursor.execute("SELECT 1")
+            alive = cursor.fetchone() is not None
+            cursor.close()
+            conn.rollback()  # Fin de transaction : annule le SET LOCAL
+        except Exception as e:
+            logger.warning(f"[DB PING] [WARN] Serveur injoignable: {e}")
+        finally:
+            if conn:
+                try:
+                    self._pool.putconn(conn, close=not alive)
+                except:
+                    pass
+        
+        return alive
+    
     @property
     def is_connected(self) -> bool:
         """Vérifie état connexion actuelle."""
@@ -177,7 +260,8 @@ class DatabaseManager:
         query: str,
         params: Optional[tuple] = None,
         fetch: bool = True,
-        max_retries: int = 2
+        max_retries: int = 2,
+        timeout_ms: Optional[int] = None
     ) -> Optional[List[Dict]]:
         """
         Exécute requête SQL avec retry automatique.
@@ -187,6 +271,8 @@ class DatabaseManager:
             params: Paramètres
             fetch: True pour SELECT, False pour INSERT/UPDATE/DELETE
             max_retries: Nombre de tentatives
+            timeout_ms: statement_timeout (ms) limité à cette requête
+                (SET LOCAL) ; une requête annulée n'est pas retentée
             
         Returns:
             Liste de dicts (si fetch=True) ou liste vide (si fetch=False)
@@ -200,17 +286,21 @@ class DatabaseManager:
         for attempt in range(max_retries):
             conn = None
             try:
-                conn = self._pool.getconn()
+                conn = self._get_connection()
                 cursor = conn.cursor(cursor_factory=RealDictCursor)
                 
                 logger.debug(f"[QUERY] Execution (tentative {attempt+1}): {query[:100]}...")
                 
+                if timeout_ms is not None:
+                    cursor.execute("SET LOCAL statement_timeout = %s", (timeout_ms,))
                 cursor.execute(query, params or ())
                 
                 if fetch:
                     results = cursor.fetchall()
                     logger.debug(f"[QUERY] [OK] {len(results)} ligne(s) recuperee(s)")
                     cursor.close()
+                    if timeout_ms is not None:
+                        conn.rollback()  # Fin de transaction : annule le SET LOCAL
                     self._pool.putconn(conn)
                     return [dict(row) for row in results]
                 else:
@@ -219,6 +309,21 @@ class DatabaseManager:
                     cursor.close()
                     self._pool.putconn(conn)
                     return []
+            
+            except psycopg2.extensions.QueryCanceledError as e:
+                # statement_timeout atteint : retenter doublerait l'attente
+                logger.warning(f"[QUERY] [WARN] Requete annulee (timeout {timeout_ms} ms): {e}")
+                
+                if conn:
+                    try:
+                        conn.rollback()
+                    except:
+                        pass
+                    try:
+                        self._pool.putconn(conn)
+                    except:
+                        pass
+                return None
                     
             except psycopg2.OperationalError as e:
                 last_error = e
@@ -346,7 +451,7 @@ class DatabaseManager:
             
             logger.debug("[SAVE] 3/6 Obtention connexion...")
             
-            conn = self._pool.getconn()
+            conn = self._get_connection()
             logger.debug("[SAVE] Connexion obtenue du pool")
             
             # ═══════════════════════════════════════════════════════════
@@ -545,7 +650,9 @@ class DatabaseManager:
             LIMIT %s
         """
         
-        results = self.execute_query(query, (limit,), fetch=True)
+        results = self.execute_query(
+            query, (limit,), fetch=True, timeout_ms=_LIVE_READ_TIMEOUT_MS
+        )
         
         if not results:
             logger.warning("[GET] Aucune prediction trouvee")
@@ -592,26 +699,26 @@ class DatabaseManager:
             return stats
         
         try:
+            # Tous les KPI en une seule requête (un seul aller-retour)
             query = """
-                WITH stats_data AS (
-                    SELECT 
-                        COUNT(*) as total_preds,
-                        COUNT(DISTINCT hash_formulation) as unique_forms,
-                        COUNT(DISTINCT CASE 
-                            WHEN horodatage > NOW() - INTERVAL '24 hours' 
-                            THEN id_utilisateur 
-                        END) as active_users_24h,
-                        AVG(NULLIF(resistance_predite, 0)) as avg_resistance,
-                        AVG(NULLIF(diffusion_cl_predite, 0)) as avg_diffusion,
-                        AVG(NULLIF(carbonatation_predite, 0)) as avg_carbonatation,
-                        STDDEV(NULLIF(resistance_predite, 0)) as std_resistance
-                    FROM predictions
-                    WHERE horodatage > NOW() - INTERVAL '365 days'
-                )
-                SELECT * FROM stats_data
+                SELECT 
+                    COUNT(*) as total_preds,
+                    COUNT(DISTINCT hash_formulation) as unique_forms,
+                    COUNT(DISTINCT CASE 
+                        WHEN horodatage > NOW() - INTERVAL '24 hours' 
+                        THEN id_utilisateur 
+                    END) as active_users_24h,
+                    AVG(NULLIF(resistance_predite, 0)) as avg_resistance,
+                    AVG(NULLIF(diffusion_cl_predite, 0)) as avg_diffusion,
+                    AVG(NULLIF(carbonatation_predite, 0)) as avg_carbonatation,
+                    STDDEV(NULLIF(resistance_predite, 0)) as std_resistance
+                FROM predictions
+                WHERE horodatage > NOW() - INTERVAL '365 days'
             """
             
-            result = self.execute_query(query, fetch=True)
+            result = self.execute_query(
+                query, fetch=True, timeout_ms=_LIVE_READ_TIMEOUT_MS
+            )
             
             if result and len(result) > 0:
                 row = result[0]
@@ -689,20 +796,23 @@ class DatabaseManager:
         
         if self.is_connected:
             try:
-                conn = self._pool.getconn()
+                conn = self._get_connection()
                 cursor = conn.cursor()
                 
-                cursor.execute("SELECT version();")
-                diag['postgresql_version'] = cursor.fetchone()[0][:100]
+                # Un seul aller-retour au lieu de quatre requêtes
+                cursor.execute("""
+                    SELECT
+                        version(),
+                        current_database(),
+                        current_user,
+                        (SELECT COUNT(*) FROM predictions);
+                """)
+                version, db_name, user, count = cursor.fetchone()
                 
-                cursor.execute("SELECT current_database();")
-                diag['database'] = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT current_user;")
-                diag['user'] = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT COUNT(*) FROM predictions;")
-                diag['predictions_count'] = cursor.fetchone()[0]
+                diag['postgresql_version'] = version[:100]
+                diag['database'] = db_name
+                diag['user'] = user
+                diag['predictions_count'] = count
                 
                 cursor.close()
                 self._pool.putconn(conn)
@@ -22,6 +22,7 @@ from app.components.forms import render_formulation_input
 from app.components.cards import info_box, metric_card
 from app.core.analyzer import ConcreteAnalyzer
 from app.core.session_manager import initialize_session
+from app.models.model_config import DEFAULT_MODELS_DIR, MODEL_FILENAME
 
 # IMPORTS NOUVEAUX MOTEURS
 from app.lab.monte_carlo_engine import MonteCarloEngine
@@ -46,6 +47,39 @@ render_sidebar(db_manager=st.session_state.get('db_manager'))
 from app.components.navbar import render_navbar
 render_navbar(current_page="Laboratoire")
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# CALCULS MIS EN CACHE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _model_identity():
+    """Identité hashable du modèle chargé : date d'entraînement + mtime du fichier."""
+    metadata = st.session_state.get('metadata') or {}
+    try:
+        mtime = (DEFAULT_MODELS_DIR / MODEL_FILENAME).stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    return metadata.get('date_trained'), mtime
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _cached_surfaces(baseline, param_x, param_y, _model, model_id, features, cement_type, resolution):
+    """
+    4 surfaces pour une configuration donnée.
+
+    Le modèle lui-même n'est pas hashé (_model) : `model_id` le remplace dans
+    la clé, pour qu'un modèle réentraîné n'hérite pas des surfaces de l'ancien.
+    """
+    return SurfaceEngine().generate_all_surfaces(
+        baseline=baseline,
+        param1=param_x,
+        param2=param_y,
+        model=_model,
+        feature_list=features,
+        cement_type=cement_type,
+        resolution=resolution
+    )
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # HEADER
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -154,16 +188,17 @@ if mode == "🔍 Sensibilité Simple":
                     targets = ['Resistance', 'Diffusion_Cl', 'Carbonatation']
                     colors = [COLOR_PALETTE['primary'], COLOR_PALETTE['success'], COLOR_PALETTE['warning']]
                     
-                    for i, (target, color) in enumerate(zip(targets, colors), start=1):
+                    fig.add_traces(
+                        [go.Scatter(x=param_values, y=sensitivity_result.impacts[target], mode='lines+markers',
+                                    line=dict(color=color, width=3), marker=dict(size=6),
+                                    showlegend=False)
+                         for target, color in zip(targets, colors)],
+                        rows=[1, 2, 3], cols=1
+                    )
+                    
+                    for i, target in enumerate(targets, start=1):
                         values = sensitivity_result.impacts[target]
                         
-                        fig.add_trace(
-                            go.Scatter(x=param_values, y=values, mode='lines+markers',
-                                     line=dict(color=color, width=3), marker=dict(size=6),
-                                     showlegend=False),
-                            row=i, col=1
-                        )
-                        
                         fig.add_hline(y=values[n_points // 2], line_dash="dash", line_color="gray", row=i, col=1)
                         fig.add_vline(x=sensitivity_result.baseline_value, line_dash="dot", line_color="red", row=i, col=1)
                     
@@ -238,9 +273,8 @@ elif mode == "📊 Sensibilité Multi-Paramètres":
                         st.dataframe(df_elast, use_container_width=True)
                         
                         # Graphique comparatif
-                        fig_comp = go.Figure()
-                        for param in params_to_compare:
-                            fig_comp.add_trace(go.Bar(
+                        fig_comp = go.Figure(data=[
+                            go.Bar(
                                 name=param,
                                 x=['Resistance', 'Diffusion Cl-', 'Carbonatation'],
                                 y=[
@@ -248,7 +282,9 @@ elif mode == "📊 Sensibilité Multi-Paramètres":
                                     results[param].elasticities.get('Diffusion_Cl', 0),
                                     results[param].elasticities.get('Carbonatation', 0)
                                 ]
-                            ))
+                            )
+                            for param in params_to_compare
+                        ])
                         
                         fig_comp.update_layout(
                             title="Comparaison des Elasticites",
@@ -481,17 +517,10 @@ elif mode == "📐 Surfaces 3D + CO₂":
                     model = st.session_state.get('model')
                     features = st.session_state.get('features')
                     
-                    # NOUVEAU MOTEUR
-                    engine = SurfaceEngine()
-                    
-                    multi_surf = engine.generate_all_surfaces(
-                        baseline=baseline_3d,
-                        param1=param_x,
-                        param2=param_y,
-                        model=model,
-                        feature_list=features,
-                        cement_type=selected_cement_3d,
-                        resolution=resolution
+                    # NOUVEAU MOTEUR (résultat mis en cache par configuration)
+                    multi_surf = _cached_surfaces(
+                        baseline_3d, param_x, param_y, model, _model_identity(),
+                        features, selected_cement_3d, resolution
                     )
                     
                     st.success("4 surfaces générées")
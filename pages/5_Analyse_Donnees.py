@@ -27,6 +27,7 @@ from config.constants import COLOR_PALETTE
 from app.styles.theme import apply_custom_theme
 from app.components.sidebar import render_sidebar
 from app.components.cards import info_box
+from app.components.charts import lttb_indices, scatter_cls
 
 from app.core.session_manager import initialize_session
 initialize_session()
@@ -245,14 +246,19 @@ tab_trends, tab_distrib, tab_corr, tab_time = st.tabs([
 with tab_trends:
     st.markdown("### 📊 Tendances des Cibles")
 
+    # Sous-échantillonnage LTTB par trace (no-op sous le seuil de points) ;
+    # la classe de trace suit la taille de la série source
+    keep_r = lttb_indices(df.index, df["Résistance"])
+    keep_d = lttb_indices(df.index, df["Diffusion_Cl"])
+
     fig_trends = go.Figure()
-    fig_trends.add_trace(go.Scatter(
-        x=df.index, y=df["Résistance"],
+    fig_trends.add_trace(scatter_cls(len(df))(
+        x=df.index[keep_r], y=df["Résistance"].iloc[keep_r],
         mode="lines+markers", name="Résistance (MPa)",
         line=dict(color=COLOR_PALETTE["primary"], width=2), marker=dict(size=5),
     ))
-    fig_trends.add_trace(go.Scatter(
-        x=df.index, y=df["Diffusion_Cl"],
+    fig_trends.add_trace(scatter_cls(len(df))(
+        x=df.index[keep_d], y=df["Diffusion_Cl"].iloc[keep_d],
         mode="lines+markers", name="Diffusion Cl⁻",
         yaxis="y2",
         line=dict(color=COLOR_PALETTE["success"], width=2), marker=dict(size=5),
@@ -312,8 +318,9 @@ with tab_corr:
     else:
         df_corr = df[numeric_cols].corr(method="pearson")
 
+        # float32 suffit à l'affichage (2 décimales) et divise par deux la charge JSON
         fig_corr = px.imshow(
-            df_corr, text_auto=".2f", aspect="auto",
+            df_corr.astype(np.float32), text_auto=".2f", aspect="auto",
             color_continuous_scale="RdBu_r", zmin=-1, zmax=1,
             labels=dict(color="Corrélation"),
         )
@@ -322,17 +329,18 @@ with tab_corr:
 
         # Top corrélations
         st.markdown("#### 🔝 Corrélations Fortes")
-        corr_matrix = df_corr.where(~np.eye(len(df_corr), dtype=bool))
-        corr_pairs = (
-            corr_matrix.stack()
-            .reset_index()
-            .rename(columns={"level_0": "Variable 1", "level_1": "Variable 2", 0: "Corrélation"})
-        )
-        corr_pairs["pair"] = corr_pairs.apply(
-            lambda x: tuple(sorted([x["Variable 1"], x["Variable 2"]])), axis=1
-        )
-        corr_pairs = corr_pairs.drop_duplicates("pair").drop(columns="pair")
-        corr_pairs = corr_pairs[corr_pairs["Corrélation"].abs() > 0.1]
+        # Triangle supérieur strict (paires uniques, sans diagonale) extrait
+        # en NumPy : pas de stack/apply ligne à ligne ni de drop_duplicates
+        corr_vals = df_corr.to_numpy()
+        corr_names = df_corr.columns.to_numpy()
+        iu, ju = np.triu_indices(len(corr_names), k=1)
+        pair_r = corr_vals[iu, ju]
+        strong = np.abs(pair_r) > 0.1  # NaN → False
+        corr_pairs = pd.DataFrame({
+            "Variable 1": corr_names[iu[strong]],
+            "Variable 2": corr_names[ju[strong]],
+            "Corrélation": pair_r[strong],
+        })
 
         if not corr_pairs.empty:
             top_corr = (
@@ -392,18 +400,30 @@ with tab_time:
             df_trend["Timestamp"] = df_trend["Date"].astype("int64") // 10**9
 
             if len(df_trend) > 2:
-                z = np.polyfit(df_trend["Timestamp"], df_trend["Résistance"], 1)
-                p = np.poly1d(z)
-                df_trend["Tendance"] = p(df_trend["Timestamp"])
+                # Régression linéaire en forme close (une seule conversion ndarray)
+                t = df_trend["Timestamp"].to_numpy(dtype=np.float64)
+                r = df_trend["Résistance"].to_numpy(dtype=np.float64)
+                tc = t - t.mean()
+                ss_t = np.dot(tc, tc)
+                # Σ tc = 0 : inutile de centrer r pour le produit scalaire
+                slope = np.dot(tc, r) / ss_t if ss_t > 0 else 0.0
+
+                # Une droite suffit de ses deux extrémités (dates triées) :
+                # évaluée en place dans un buffer de 2 points au lieu de N
+                trend = tc[[0, -1]]
+                np.multiply(trend, slope, out=trend)
+                trend += r.mean()
+
+                keep = lttb_indices(df_trend["Timestamp"], df_trend["Résistance"])
 
                 fig_trend = go.Figure()
-                fig_trend.add_trace(go.Scatter(
-                    x=df_trend["Date"], y=df_trend["Résistance"],
+                fig_trend.add_trace(scatter_cls(len(df_trend))(
+                    x=df_trend["Date"].iloc[keep], y=df_trend["Résistance"].iloc[keep],
                     mode="markers", name="Données",
                     marker=dict(size=6, opacity=0.5),
                 ))
                 fig_trend.add_trace(go.Scatter(
-                    x=df_trend["Date"], y=df_trend["Tendance"],
+                    x=df_trend["Date"].iloc[[0, -1]], y=trend,
                     mode="lines", name="Tendance",
                     line=dict(color="red", width=2, dash="dash"),
                 ))
@@ -0,0 +1,246 @@
+"""
+tests/test_charts.py
+════════════════════
+Tests unitaires — app/components/charts.py
+
+Couvre :
+  - lttb_indices() : bornes conservées, indices strictement croissants,
+    taille n_out, passage inchangé si len <= n_out
+  - _figure_cache (plot_composition_pie) : ordre de l'appelant conservé,
+    figure neuve à chaque appel, modifications sans effet sur le cache
+  - plot_contour_2d() : grille d'affichage réduite sans propager les NaN
+  - plot_heatmap_correlation() : NaN isolés exclus paire par paire
+  - plot_sensitivity() : une trace, une ligne baseline et une annotation par
+    cible ; bascule Scattergl selon la taille de la série source
+"""
+import sys
+import os
+import json
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import pytest
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from app.core.analyzer import SensitivityResult
+from app.components.charts import (
+    MAX_PLOT_POINTS, WEBGL_THRESHOLD, lttb_indices, plot_composition_pie,
+    plot_contour_2d, plot_heatmap_correlation, plot_sensitivity,
+)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIXTURES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@pytest.fixture
+def sensitivity_result():
+    """Sensibilité du ciment sur deux cibles, 11 points."""
+    x = np.linspace(250, 450, 11)
+    return SensitivityResult(
+        parameter_name="Ciment",
+        baseline_value=350.0,
+        variation_range=(250.0, 450.0),
+        impacts={
+            "Resistance": (0.1 * x).tolist(),
+            "Diffusion_Cl": (20 - 0.02 * x).tolist(),
+        },
+        elasticities={"Resistance": 1.0, "Diffusion_Cl": -0.5},
+    )
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TESTS lttb_indices
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestLttbIndices:
+
+    @pytest.fixture
+    def serie(self):
+        rng = np.random.default_rng(0)
+        x = np.arange(5000, dtype=float)
+        return x, np.sin(x / 200) + rng.normal(0, 0.1, x.size)
+
+    def test_taille_n_out(self, serie):
+        assert len(lttb_indices(*serie, n_out=300)) == 300
+
+    def test_extremites_conservees(self, serie):
+        idx = lttb_indices(*serie, n_out=300)
+        assert idx[0] == 0
+        assert idx[-1] == len(serie[0]) - 1
+
+    def test_indices_strictement_croissants(self, serie):
+        idx = lttb_indices(*serie, n_out=300)
+        assert np.all(np.diff(idx) > 0)
+        assert len(np.unique(idx)) == len(idx)
+
+    def test_pic_conserve(self, serie):
+        x, y = serie
+        y = y.copy()
+        y[2500] = 100.0
+        assert 2500 in lttb_indices(x, y, n_out=300)
+
+    @pytest.mark.parametrize("n", [1, 10, 300])
+    def test_serie_courte_inchangee(self, n):
+        x = np.arange(n, dtype=float)
+        np.testing.assert_array_equal(lttb_indices(x, x, n_out=300), np.arange(n))
+
+    def test_abscisses_datetime(self):
+        x = np.arange("2024-01-01", "2024-12-31", dtype="datetime64[D]")
+        y = np.arange(len(x), dtype=float)
+        idx = lttb_indices(x, y, n_out=50)
+        assert len(idx) == 50 and idx[0] == 0 and idx[-1] == len(x) - 1
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TESTS _figure_cache (via plot_composition_pie)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestFigureCache:
+
+    COMPOSITION = {"Eau": 175.0, "Ciment": 350.0, "SableFin": 800.0, "Laitier": 0.0}
+
+    def test_ordre_appelant_conserve(self):
+        fig = plot_composition_pie(self.COMPOSITION)
+        assert list(fig.data[0].values) == [175.0, 350.0, 800.0]
+
+    def test_ordre_different_figure_differente(self):
+        fig = plot_composition_pie(self.COMPOSITION)
+        reordered = plot_composition_pie(dict(reversed(self.COMPOSITION.items())))
+        assert reordered is not fig
+        assert list(reordered.data[0].values) == [800.0, 350.0, 175.0]
+
+    def test_hit_identique_au_trace(self):
+        fig = plot_composition_pie(self.COMPOSITION)
+        fresh = plot_composition_pie.__wrapped__(self.COMPOSITION)
+        assert json.loads(fig.to_json()) == json.loads(fresh.to_json())
+
+    def test_hit_renvoie_figure_neuve(self):
+        assert plot_composition_pie(self.COMPOSITION) is not plot_composition_pie(self.COMPOSITION)
+
+    @pytest.mark.parametrize("mutate", [
+        lambda f: f.update_layout(title="modifié"),
+        lambda f: setattr(f.layout.title, "text", "modifié"),
+        lambda f: setattr(f.data[0], "values", [1, 2, 3]),
+        lambda f: f.update_traces(hole=0),
+    ])
+    def test_modification_sans_effet_sur_le_cache(self, mutate):
+        mutate(plot_composition_pie(self.COMPOSITION))
+        fig = plot_composition_pie(self.COMPOSITION)
+        assert fig.layout.title.text == "Composition du Béton"
+        assert list(fig.data[0].values) == [175.0, 350.0, 800.0]
+        assert fig.data[0].hole == 0.4
+
+    def test_arguments_nommes_meme_cle(self):
+        """Positionnel, nommé ou défaut implicite : une seule entrée de cache."""
+        plot_composition_pie.cache_clear()
+        plot_composition_pie(self.COMPOSITION)
+        plot_composition_pie(self.COMPOSITION, "Composition du Béton")
+        plot_composition_pie(composition=self.COMPOSITION, title="Composition du Béton")
+        info = plot_composition_pie.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TESTS plot_contour_2d
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestPlotContour2d:
+
+    @pytest.fixture
+    def grille(self):
+        X, Y = np.meshgrid(np.linspace(250, 450, 100), np.linspace(150, 200, 100))
+        return X, Y, X / Y
+
+    def test_grille_reduite_bords_conserves(self, grille):
+        X, Y, Z = grille
+        fig = plot_contour_2d(X, Y, Z, "Ciment", "Eau", "Resistance", display_resolution=40)
+        assert np.asarray(fig.data[0].z).shape == (40, 40)
+        assert fig.data[0].x[0] == 250 and fig.data[0].x[-1] == 450
+        assert fig.data[0].y[0] == 150 and fig.data[0].y[-1] == 200
+
+    def test_nan_non_propage(self, grille):
+        X, Y, Z = grille
+        Z = Z.copy()
+        Z[::3, ::3] = np.nan
+        fig = plot_contour_2d(X, Y, Z, "Ciment", "Eau", "Resistance", display_resolution=40)
+        z = np.asarray(fig.data[0].z)
+        # Un tiers des lignes et colonnes porte des NaN (1/9 des cellules) :
+        # une interpolation les étendrait à presque toute la grille
+        assert np.isnan(z).mean() < 0.2
+        finite = z[np.isfinite(z)]
+        assert finite.min() >= np.nanmin(Z) - 1e-6 and finite.max() <= np.nanmax(Z) + 1e-6
+
+    def test_grille_petite_inchangee(self, grille):
+        X, Y, Z = (a[:20, :20] for a in grille)
+        fig = plot_contour_2d(X, Y, Z, "Ciment", "Eau", "Resistance", display_resolution=40)
+        np.testing.assert_allclose(np.asarray(fig.data[0].z), Z, rtol=1e-6)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TESTS plot_heatmap_correlation
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestPlotHeatmapCorrelation:
+
+    DATA = {
+        "Ciment":     [300.0, 320.0, 350.0, 380.0, 400.0, 420.0],
+        "Eau":        [190.0, 185.0, 175.0, 170.0, 165.0, 160.0],
+        "Resistance": [25.0, 28.0, np.nan, 36.0, 40.0, 43.0],
+    }
+
+    def test_sans_nan_identique_corrcoef(self):
+        data = {k: v for k, v in self.DATA.items() if k != "Resistance"}
+        fig = plot_heatmap_correlation(data)
+        expected = np.corrcoef([data["Ciment"], data["Eau"]])
+        np.testing.assert_allclose(np.asarray(fig.data[0].z), expected, rtol=1e-6)
+
+    def test_nan_exclu_paire_par_paire(self):
+        fig = plot_heatmap_correlation(self.DATA)
+        z = np.asarray(fig.data[0].z)
+        assert np.isfinite(z).all()
+        expected = pd.DataFrame(self.DATA).corr().to_numpy()
+        np.testing.assert_allclose(z, expected, rtol=1e-6)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TESTS plot_sensitivity
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestPlotSensitivity:
+
+    def test_une_trace_par_cible(self, sensitivity_result):
+        fig = plot_sensitivity(sensitivity_result)
+        assert len(fig.data) == 2
+
+    def test_baselines_presentes(self, sensitivity_result):
+        """Les lignes baseline ne doivent pas être écartées comme sous-graphiques vides."""
+        fig = plot_sensitivity(sensitivity_result)
+        assert len(fig.layout.shapes) == 2
+        baseline_texts = [a.text for a in fig.layout.annotations if a.text.startswith("Baseline")]
+        assert len(baseline_texts) == 2
+
+    def test_scatter_svg_petite_serie(self, sensitivity_result):
+        fig = plot_sensitivity(sensitivity_result)
+        assert all(isinstance(t, go.Scatter) for t in fig.data)
+
+    def test_scattergl_grande_serie(self):
+        """Au-delà de WEBGL_THRESHOLD points source, WebGL même après LTTB."""
+        n = WEBGL_THRESHOLD + 1000
+        x = np.linspace(250, 450, n)
+        result = SensitivityResult(
+            parameter_name="Ciment",
+            baseline_value=350.0,
+            variation_range=(250.0, 450.0),
+            impacts={"Resistance": np.sin(x / 10).tolist()},
+            elasticities={"Resistance": 1.0},
+        )
+        fig = plot_sensitivity(result)
+        assert isinstance(fig.data[0], go.Scattergl)
+        assert len(fig.data[0].x) == MAX_PLOT_POINTS
+
+    def test_baseline_au_point_central(self, sensitivity_result):
+        fig = plot_sensitivity(sensitivity_result)
+        expected = sensitivity_result.impacts["Resistance"][5]
+        assert fig.layout.shapes[0].y0 == pytest.approx(expected)
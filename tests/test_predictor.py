@@ -10,6 +10,7 @@ Couvre :
   - Gestion MK=0 via predict_with_mk → identique à predict_concrete_properties
   - Cohérence Ratio_E_L calculé vs composition
   - Liant_Total = ciment + additions
+  - predict_batch() : mêmes valeurs que predict_concrete_properties() ligne à ligne
 """
 import sys
 import os
@@ -18,7 +19,8 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 import pytest
 import numpy as np
 from unittest.mock import MagicMock, patch
-from app.core.predictor import predict_concrete_properties, predict_with_mk
+import pandas as pd
+from app.core.predictor import predict_concrete_properties, predict_with_mk, predict_batch, TARGETS_ORDER
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -188,4 +190,36 @@ class TestPredictWithMk:
             mk_corrector=mk_corrector,
         )
         delta = res_mk["Resistance"] - res_base["Resistance"]
-        assert delta <= 25.0, f"Correction MK trop élevée : {delta:.1f} MPa"
\ No newline at end of file
+        assert delta <= 25.0, f"Correction MK trop élevée : {delta:.1f} MPa"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TESTS predict_batch
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class LinearModel:
+    """Modèle déterministe dépendant des features (le MockModel est constant)."""
+
+    def predict(self, X) -> np.ndarray:
+        X = np.asarray(X, dtype=float)
+        w = np.linspace(0.01, 0.2, X.shape[1])
+        return np.column_stack([X @ w / 20, X @ w[::-1] / 300, np.sqrt(X @ w)])
+
+
+class TestPredictBatch:
+
+    def test_identique_prediction_unitaire(self, composition_standard, composition_hpc):
+        """Chaque ligne du lot = predict_concrete_properties() sur la même composition."""
+        compositions = [composition_standard, composition_hpc, {"Ciment": 400.0, "Eau": 160.0}]
+        preds = predict_batch(pd.DataFrame(compositions), LinearModel())
+
+        assert preds.shape == (3, len(TARGETS_ORDER))
+        for row, composition in zip(preds, compositions):
+            expected = predict_concrete_properties(composition, LinearModel(), validate=False)
+            assert row.tolist() == [expected[t] for t in TARGETS_ORDER]
+
+    def test_echec_modele_leve_runtime_error(self, composition_standard):
+        model = MagicMock()
+        model.predict.side_effect = ValueError("shape mismatch")
+        with pytest.raises(RuntimeError):
+            predict_batch(pd.DataFrame([composition_standard]), model)